@@ -1,5 +1,7 @@
 from celery import Celery
+from celery.signals import worker_process_shutdown
 import config_loader
+from utils import log_helpers
 from config_loader import CELERY_RESULT_EXPIRES, CELERY_TASK_SOFT_TIME_LIMIT, CELERY_TASK_TIME_LIMIT
 # Create celery_app
 celery_app = Celery("File Processor")
@@ -33,3 +35,9 @@ celery_app.conf.update(
     task_retry_backoff_max=30,
     task_retry_jitter=True,
 )
+
+
+@worker_process_shutdown.connect
+def _drain_log_queue(**kwargs) -> None:
+    # Pool processes leave through os._exit, which skips atexit handlers
+    log_helpers.stop_listener()
@@ -1,7 +1,6 @@
 import sys
 import json
 import asyncio
-import traceback
 import contextvars
 from pathlib import Path
 from typing import Any
@@ -14,6 +13,7 @@ from utils import log_helpers
 from utils.bucket_helper import get_bucket_name, get_s3_key_prefix
 from celery_worker.step_handler import execute_step
 
+from connections import be_connection
 from connections.be_connection import BEConnector
 from connections.redis_connection import RedisConnector
 
@@ -75,23 +75,31 @@ def task_execute(self, data: dict) -> str: # pragma: no cover  # NOSONAR
             },
         )
         ctx = contextvars.copy_context()
-        ctx.run(lambda: asyncio.run(handle_task(tracking_model)))
+        ctx.run(lambda: asyncio.run(run_task(tracking_model)))
         return "Task completed"
     
     except Exception as e:
-        # Capture full traceback as structured string list
-        full_tb = traceback.format_exception(type(e), e, e.__traceback__)
         logger.error(
             f"[{tracking_model.request_id}] Task execution failed: {e}",
             extra={
                 "service": ServiceLog.TASK_EXECUTION,
                 "log_type": LogType.ERROR,
                 "data": tracking_model,
-                "traceback": full_tb,
             },
+            exc_info=True,
         )
 
 
+async def run_task(tracking_model: TrackingModel) -> dict[str, Any]: # pragma: no cover  # NOSONAR
+    """
+    Run `handle_task` and close the backend API client opened on this task's event loop.
+    """
+    try:
+        return await handle_task(tracking_model)
+    finally:
+        await be_connection.close_client()
+
+
 async def handle_task(tracking_model: TrackingModel) -> dict[str, Any]: # pragma: no cover  # NOSONAR
     """
     Run the asynchronous file processing workflow.
@@ -515,7 +523,7 @@ def inject_metadata_into_step_result( # pragma: no cover
 
     # Case 1: data is a Pydantic model
     if isinstance(data, BaseModel):
-        logger.debug(f"Step [{step.stepName}] - Injecting metadata into Pydantic model")
+        logger.debug("Step [%s] - Injecting metadata into Pydantic model", step.stepName)
         step_result.data = data.model_copy(
             update={
                 "step_detail": step_detail,
@@ -527,7 +535,7 @@ def inject_metadata_into_step_result( # pragma: no cover
 
     # Case 2: data is a dict
     if isinstance(data, dict):
-        logger.debug(f"Step [{step.stepName}] - Processing dict data for metadata injection")
+        logger.debug("Step [%s] - Processing dict data for metadata injection", step.stepName)
 
         json_data = data.get("json_data", {})
         raw_output = getattr(json_data, "data", None) or json_data.get("data")
@@ -540,7 +548,7 @@ def inject_metadata_into_step_result( # pragma: no cover
             document_type=document_type,
             data=raw_output,
         )
-        logger.debug(f"Step [{step.stepName}] - Successfully parsed data, injecting metadata")
+        logger.debug("Step [%s] - Successfully parsed data, injecting metadata", step.stepName)
         step_result.data = parsed_output.model_copy(
             update={
                 "step_detail": step_detail,
@@ -1,4 +1,3 @@
-import traceback
 import asyncio
 from urllib.parse import urlparse
 from pydantic import BaseModel
@@ -126,14 +125,12 @@ async def execute_step(file_processor: ProcessorBase, context_data: ContextData,
         return result
 
     except Exception as e:
-        full_tb = traceback.format_exception(type(e), e, e.__traceback__)
         logger.exception(
             f"Error occurred while executing step '{step_name}': {e}",
             extra={
                 "service": ServiceLog.STEP_EXECUTION,
                 "log_type": LogType.ERROR,
                 "data": file_processor.tracking_model,
-                "traceback": full_tb,
             },
         )
         schema_object = build_schema_object(file_processor,context_data)
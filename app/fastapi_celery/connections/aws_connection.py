@@ -1,8 +1,9 @@
 import json
 from utils import log_helpers
 from typing import Optional
-import traceback
+import threading
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import config_loader
 from models.tracking_models import ServiceLog, LogType
@@ -13,6 +14,26 @@ logger = log_helpers.get_logger("AWS Connection")
 # === Environment setup ===
 aws_region = config_loader.get_env_variable("s3_buckets", "default_region")
 
+# === Shared S3 clients ===
+# boto3 clients are thread-safe, so one client per region serves every bucket
+# and thread, and its connection pool stays warm between S3 calls
+_S3_CLIENT_CONFIG = Config(max_pool_connections=50, tcp_keepalive=True)
+_s3_clients: dict[str, object] = {}
+_s3_clients_lock = threading.Lock()
+
+
+def _get_s3_client(region_name: str):
+    """Return the process-wide S3 client for a region, creating it on first use."""
+    client = _s3_clients.get(region_name)
+    if client is None:
+        with _s3_clients_lock:
+            client = _s3_clients.get(region_name)
+            if client is None:
+                client = boto3.client("s3", region_name=region_name, config=_S3_CLIENT_CONFIG)
+                _s3_clients[region_name] = client
+    return client
+
+
 # === S3 Connector using boto3 ===
 class S3Connector:
     """AWS S3 Connector using boto3 for bucket operations.
@@ -35,8 +56,8 @@ class S3Connector:
             or config_loader.get_env_variable("AWS_REGION", "ap-southeast-1")
         ).strip()
 
-        # Initialize boto3 client with region and optional credentials
-        self.client = boto3.client("s3", region_name=self.region_name)
+        # Reuse the shared client for this region
+        self.client = _get_s3_client(self.region_name)
 
         # Check if bucket exists or try to create it
         self._ensure_bucket_exists()
@@ -71,14 +92,13 @@ class S3Connector:
                 )
                 self._create_bucket()
             else:
-                full_tb = traceback.format_exception(type(e), e, e.__traceback__)
                 logger.error(
                     f"Error checking bucket '{self.bucket_name}': {type(e).__name__} - {e}\n",
                     extra={
                         "service": ServiceLog.FILE_STORAGE,
                         "log_type": LogType.ERROR,
-                        "traceback": full_tb,
                     },
+                    exc_info=True,
                 )
                 raise
 
@@ -108,14 +128,13 @@ class S3Connector:
                 },
             )
         except ClientError as e:
-            full_tb = traceback.format_exception(type(e), e, e.__traceback__)
             logger.error(
                 f"Error creating bucket '{self.bucket_name}': {type(e).__name__} - {e}\n",
                 extra={
                     "service": ServiceLog.FILE_STORAGE,
                     "log_type": LogType.ERROR,
-                    "traceback": full_tb,
                 },
+                exc_info=True,
             )
             raise
 
@@ -168,6 +187,6 @@ class AWSSecretsManager:
             else:
                 logger.error(f"ClientError retrieving secret '{secret_name}': {error_code} - {e}")
         except Exception as e:
-            logger.error(f"Error retrieving secret: {e} - {traceback.format_exc()}")
+            logger.error(f"Error retrieving secret: {e}", exc_info=True)
 
         return None
@@ -1,3 +1,5 @@
+import asyncio
+import weakref
 import httpx
 from typing import Any
 from models.tracking_models import ServiceLog, LogType
@@ -11,6 +13,31 @@ API_KEY = config_loader.get_env_variable("JWT_SECRET_KEY")
 JWT_TOKEN_KEY = "jwt_token"
 jwt_request = {"type": "AUTHENTICATE_DATA_WORKFLOW_CODE"}
 
+# One pooled client per event loop: the API runs a single loop for its lifetime,
+# while each Celery task gets a fresh loop from asyncio.run, and httpx
+# connections cannot be carried from one loop to another.
+_CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64, keepalive_expiry=60)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=_CLIENT_LIMITS)
+        _clients[loop] = client
+    return client
+
+
+async def close_client() -> None:
+    """Close the shared client of the running event loop, if one was opened."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class BEConnector:
     """
@@ -76,51 +103,51 @@ class BEConnector:
         Returns:
             dict[str, Any] | None: Parsed response data or None on failure.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                headers = {"X-Token": API_KEY}
-                response = await client.request(
-                    method,
-                    self.api_url,
-                    headers=headers,
-                    json=self.body_data,
-                    params=self.params,
-                )
-                response.raise_for_status()
-                response_data = response.json()
-                return response_data.get("data", {})
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "API request failed with HTTPStatusError",
-                    exc_info=True,
-                    extra={
-                        "service": ServiceLog.CALL_BE_API,
-                        "log_type": LogType.ERROR,
-                        "url": self.api_url,
-                        "method": method,
-                        "params": self.params,
-                        "body": self.body_data,
-                        "status_code": e.response.status_code if e.response else None,
-                        "response_text": e.response.text if e.response else None,
-                        "error_type": type(e).__name__,
-                        "error_message": str(e),
-                    },
-                )
-            except Exception as e:
-                logger.error(
-                    "API request raised unexpected exception",
-                    exc_info=True,
-                    extra={
-                        "service": ServiceLog.CALL_BE_API,
-                        "log_type": LogType.ERROR,
-                        "url": self.api_url,
-                        "method": method,
-                        "params": self.params,
-                        "body": self.body_data,
-                        "error_type": type(e).__name__,
-                        "error_message": str(e) or "No message",
-                    },
-                )
+        client = _get_client()
+        try:
+            headers = {"X-Token": API_KEY}
+            response = await client.request(
+                method,
+                self.api_url,
+                headers=headers,
+                json=self.body_data,
+                params=self.params,
+            )
+            response.raise_for_status()
+            response_data = response.json()
+            return response_data.get("data", {})
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "API request failed with HTTPStatusError",
+                exc_info=True,
+                extra={
+                    "service": ServiceLog.CALL_BE_API,
+                    "log_type": LogType.ERROR,
+                    "url": self.api_url,
+                    "method": method,
+                    "params": self.params,
+                    "body": self.body_data,
+                    "status_code": e.response.status_code if e.response else None,
+                    "response_text": e.response.text if e.response else None,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                },
+            )
+        except Exception as e:
+            logger.error(
+                "API request raised unexpected exception",
+                exc_info=True,
+                extra={
+                    "service": ServiceLog.CALL_BE_API,
+                    "log_type": LogType.ERROR,
+                    "url": self.api_url,
+                    "method": method,
+                    "params": self.params,
+                    "body": self.body_data,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e) or "No message",
+                },
+            )
         return None
 
     def get_field(self, key: str) -> Any | None:
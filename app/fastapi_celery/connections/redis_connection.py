@@ -187,10 +187,56 @@ class RedisConnector:
     def get_all_steps_for_task(self, celery_id: str) -> dict[str, dict]:
         """Retrieve all step_processing data for a given celery_id."""
         pattern = f"celery_task:{celery_id}:step_id:*"
+        keys = [
+            key.decode() if isinstance(key, bytes) else key
+            for key in self.redis_client.scan_iter(pattern)
+        ]
+        step_ids = [key.split(":")[-1] for key in keys]
+        if not keys:
+            return {}
+
+        # Fetch every step hash in one round trip instead of one HGETALL per step
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hgetall(key)
+        try:
+            rows = pipe.execute()
+        except RedisError as e:
+            logger.error(
+                "[Redis] Failed to fetch step_processing for task",
+                exc_info=True,
+                extra={
+                    "service": ServiceLog.REDIS_SERVICE,
+                    "log_type": LogType.ERROR,
+                    "celery_id": celery_id,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                },
+            )
+            return dict.fromkeys(step_ids)
+
         result = {}
-        for key in self.redis_client.scan_iter(pattern):
-            step_id = (key.decode() if isinstance(key, bytes) else key).split(":")[-1]
-            result[step_id] = self.get_step_processing(celery_id, step_id)
+        for step_id, data in zip(step_ids, rows):
+            if not data:
+                result[step_id] = None
+                continue
+            deserialized = {}
+            for k, v in data.items():
+                try:
+                    deserialized[k] = json.loads(v)
+                except (TypeError, json.JSONDecodeError):
+                    deserialized[k] = v  # fallback
+            result[step_id] = deserialized
+
+        logger.info(
+            "[Redis] Retrieved all step_processing for task",
+            extra={
+                "service": ServiceLog.REDIS_SERVICE,
+                "log_type": LogType.ACCESS,
+                "celery_id": celery_id,
+                "step_ids": step_ids,
+            },
+        )
         return result
 
     # === Store celery_task ===
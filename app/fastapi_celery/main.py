@@ -3,8 +3,9 @@ from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 from routers import api_file_processor, api_healthcheck
+from connections import be_connection
 import config_loader
-from utils.middlewares.middlewares import RequestIDMiddleware, AccessLogFilterMiddleware
+from utils.middlewares.middlewares import RequestIDMiddleware, install_access_log_filter
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
@@ -29,12 +30,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # # Startup logic
     # Application runs here, during this time the app is alive
     yield
-    # Shutdown logic can go here if needed (after `yield`)
+    # Shutdown logic: release the pooled backend API connections
+    await be_connection.close_client()
 
 
 app = FastAPI(lifespan=lifespan, root_path="/fastapi")
+install_access_log_filter(exclude_paths=["/fastapi/api_health"])
 app.add_middleware(RequestIDMiddleware)
-app.add_middleware(AccessLogFilterMiddleware, exclude_paths=["/fastapi/api_health"])
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Restrict in production!
@@ -1,6 +1,7 @@
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from enum import Enum
 import config_loader
@@ -50,6 +51,17 @@ class StatusEnum(str, Enum):
         return self.name
 
 
+@lru_cache(maxsize=1)
+def _compute_base_url() -> str:
+    """Resolve the backend base URL from the environment once per process."""
+    env = Environment(config_loader.get_env_variable("ENVIRONMENT", "prod").lower())
+    if env == Environment.DEV:
+        return config_loader.get_env_variable("BASE_API_URL", "")
+    host = config_loader.get_env_variable("BACKEND_HOST", "")
+    port = config_loader.get_env_variable("BACKEND_PORT", "")
+    return f"{host}:{port}"
+
+
 class ApiUrl(str, Enum):
     """API endpoint paths used in workflow processing."""
 
@@ -69,14 +81,7 @@ class ApiUrl(str, Enum):
     TEMPLATE_PUBLISH_DATA = "/api/workflow/publish-data"
 
     def full_url(self) -> str:
-        env = Environment(config_loader.get_env_variable("ENVIRONMENT", "prod").lower())
-        if env == Environment.DEV:
-            base_url = config_loader.get_env_variable("BASE_API_URL", "")
-        else:
-            host = config_loader.get_env_variable("BACKEND_HOST", "")
-            port = config_loader.get_env_variable("BACKEND_PORT", "")
-            base_url = f"{host}:{port}"
-        return urljoin(base_url + "/", self.value.lstrip("/"))
+        return urljoin(_compute_base_url() + "/", self.value.lstrip("/"))
 
     def __str__(self):
         return self.full_url()
@@ -105,6 +110,8 @@ class FilePathRequest(BaseModel):
 class WorkflowStep(BaseModel):
     """Represents a step in the workflow."""
 
+    model_config = ConfigDict(frozen=True)
+
     workflowStepId: str
     stepName: str
     stepOrder: int
@@ -114,6 +121,8 @@ class WorkflowStep(BaseModel):
 class WorkflowModel(BaseModel):
     """Represents a workflow structure."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str | None = None
     status: str | None = None
@@ -129,6 +138,8 @@ class WorkflowModel(BaseModel):
 class WorkflowSession(BaseModel):
     """Represents a workflow session."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     status: str
 
@@ -136,6 +147,8 @@ class WorkflowSession(BaseModel):
 class StartStep(BaseModel):
     """Request model for starting a workflow step."""
 
+    model_config = ConfigDict(frozen=True)
+
     workflowHistoryId: str
     status: str
 
@@ -171,6 +184,29 @@ class StepDefinition(BaseModel):  # pragma: no cover  # NOSONAR
         return self
 
 
+class FileRecord(TypedDict, total=False):
+    """Metadata of the file being processed, built by `extract_metadata`.
+
+    Kept as a plain dict at runtime: steps add keys along the way, look keys up
+    dynamically for request payloads, and the record is stored in Redis.
+    """
+
+    file_path: str
+    file_path_parent: str
+    source_type: str
+    object_buffer: Any
+    file_size: str
+    file_name: str
+    file_name_wo_ext: str
+    file_extension: str
+    document_type: DocumentType
+    raw_bucket_name: str
+    target_bucket_name: str
+    proceed_at: str
+    folder_name: str | None
+    customer_foldername: str | None
+
+
 class StepOutput(BaseModel):
     """Output data returned from a workflow step."""
     
@@ -1,11 +1,21 @@
 import io
 import csv
-import chardet
 from models.class_models import PODataParsed, StatusEnum
 import config_loader
 
 METADATA_SEPARATOR = config_loader.get_env_variable("METADATA_SEPARATOR", "：")
 
+_chardet = None
+
+
+def _get_chardet():
+    """Import chardet on first use so worker processes that never read CSV skip it."""
+    global _chardet
+    if _chardet is None:
+        import chardet
+        _chardet = chardet
+    return _chardet
+
 
 
 class CSVProcessor:
@@ -40,7 +50,7 @@ class CSVProcessor:
             self.file_record.get("object_buffer").seek(0)
             content = self.file_record.get("object_buffer").read()
 
-        detected = chardet.detect(content)
+        detected = _get_chardet().detect(content)
         encoding = detected["encoding"] or "utf-8"
         decoded_content = io.TextIOWrapper(
             io.BytesIO(content), encoding=encoding, errors="replace"
@@ -47,9 +47,9 @@ class ExcelProcessor(excel_helper.ExcelHelper):
                 i += 1
                 continue
 
-            # Start checking for table data
+            # Start checking for table data; rows become records as they are read
+            # instead of being buffered in a separate table block first
             header_row = row
-            table_block = []
             j = i + 1
 
             while j < len(self.rows):
@@ -61,18 +61,12 @@ class ExcelProcessor(excel_helper.ExcelHelper):
                     break
 
                 if len(current_row) == len(header_row):
-                    table_block.append(current_row)
+                    items.append(dict(zip(header_row, current_row)))
                     j += 1
                 else:
                     break
 
-            if table_block:
-                headers = header_row
-                for row_data in table_block:
-                    items.append(dict(zip(headers, row_data)))
-                i = j
-            else:
-                i += 1
+            i = j
         return PODataParsed(
             file_path=self.file_record.get("file_path"),
             document_type=self.file_record.get("document_type"),
@@ -121,15 +121,20 @@ class Pdf001Template: # pragma: no cover  # NOSONAR
             self.po_number = metadata.get("訂購編號")
 
             return build_success_response(
-                self.file_record.get("file_path"), self.file_record.get("document_type"), self.po_number, items, metadata, self.file_record.get("file_size")
+                file_path=self.file_record.get("file_path"),
+                document_type=self.file_record.get("document_type"),
+                po_number=self.po_number,
+                items=items,
+                metadata=metadata,
+                file_size=self.file_record.get("file_size"),
             )
 
         except Exception as e:
             return build_failed_response(
                 self.file_record.get("file_path"),
-                self.file_record.get("document_type"),
-                self.file_record.get("file_size"),
-                e,
+                document_type=self.file_record.get("document_type"),
+                file_size=self.file_record.get("file_size"),
+                exc=e,
             )
 
 
@@ -267,15 +272,20 @@ class Pdf002Template: # pragma: no cover  # NOSONAR
             self.po_number = metadata.get("訂單編號") or metadata.get("採購單號")
 
             return build_success_response(
-                self.file_record.get("file_path"), self.file_record.get("document_type"), self.po_number, items, metadata, self.file_record.get("file_size")
+                file_path=self.file_record.get("file_path"),
+                document_type=self.file_record.get("document_type"),
+                po_number=self.po_number,
+                items=items,
+                metadata=metadata,
+                file_size=self.file_record.get("file_size"),
             )
 
         except Exception as e:
             return build_failed_response(
                 self.file_record.get("file_path"),
-                self.file_record.get("document_type"),
-                self.file_record.get("file_size"),
-                e,
+                document_type=self.file_record.get("document_type"),
+                file_size=self.file_record.get("file_size"),
+                exc=e,
             )
 
 
@@ -423,15 +433,20 @@ class Pdf004Template: # pragma: no cover  # NOSONAR
             self.po_number = metadata.get("採購單號")
 
             return build_success_response(
-                self.file_record.get("file_path"), self.file_record.get("document_type"), self.po_number, items, metadata, self.file_record.get("file_size")
+                file_path=self.file_record.get("file_path"),
+                document_type=self.file_record.get("document_type"),
+                po_number=self.po_number,
+                items=items,
+                metadata=metadata,
+                file_size=self.file_record.get("file_size"),
             )
 
         except Exception as e:
             return build_failed_response(
                 self.file_record.get("file_path"),
-                self.file_record.get("document_type"),
-                self.file_record.get("file_size"),
-                e,
+                document_type=self.file_record.get("document_type"),
+                file_size=self.file_record.get("file_size"),
+                exc=e,
             )
 
 
@@ -600,15 +615,20 @@ class Pdf006Template: # pragma: no cover  # NOSONAR
             logger.info("File has been processed successfully.")
 
             return build_success_response(
-                self.file_record.get("file_path"), self.file_record.get("document_type"), self.po_number, items, metadata, self.file_record.get("file_size")
+                file_path=self.file_record.get("file_path"),
+                document_type=self.file_record.get("document_type"),
+                po_number=self.po_number,
+                items=items,
+                metadata=metadata,
+                file_size=self.file_record.get("file_size"),
             )
 
         except Exception as e:
             return build_failed_response(
                 self.file_record.get("file_path"),
-                self.file_record.get("document_type"),
-                self.file_record.get("file_size"),
-                e,
+                document_type=self.file_record.get("document_type"),
+                file_size=self.file_record.get("file_size"),
+                exc=e,
             )
 
 
@@ -779,15 +799,20 @@ class Pdf007Template: # pragma: no cover  # NOSONAR
             self.po_number = items[0].get("請購明細單號")
 
             return build_success_response(
-                self.file_record.get("file_path"), self.file_record.get("document_type"), self.po_number, items, metadata, self.file_record.get("file_size")
+                file_path=self.file_record.get("file_path"),
+                document_type=self.file_record.get("document_type"),
+                po_number=self.po_number,
+                items=items,
+                metadata=metadata,
+                file_size=self.file_record.get("file_size"),
             )
 
         except Exception as e:
             return build_failed_response(
                 self.file_record.get("file_path"),
-                self.file_record.get("document_type"),
-                self.file_record.get("file_size"),
-                e,
+                document_type=self.file_record.get("document_type"),
+                file_size=self.file_record.get("file_size"),
+                exc=e,
             )
 
 
@@ -881,13 +906,18 @@ class Pdf008Template: # pragma: no cover  # NOSONAR
             self.po_number = items[0].get("退貨單號")
 
             return build_success_response(
-                self.file_record.get("file_path"), self.file_record.get("document_type"), self.po_number, items, metadata, self.file_record.get("file_size")
+                file_path=self.file_record.get("file_path"),
+                document_type=self.file_record.get("document_type"),
+                po_number=self.po_number,
+                items=items,
+                metadata=metadata,
+                file_size=self.file_record.get("file_size"),
             )
 
         except Exception as e:
             return build_failed_response(
                 self.file_record.get("file_path"),
-                self.file_record.get("document_type"),
-                self.file_record.get("file_size"),
-                e,
+                document_type=self.file_record.get("document_type"),
+                file_size=self.file_record.get("file_size"),
+                exc=e,
             )
@@ -6,7 +6,8 @@ from models.class_models import PODataParsed, StatusEnum
 # === Set up logging ===
 logger = log_helpers.get_logger("PDF Helper")
 
-def build_success_response(file_path, document_type, po_number, items, metadata, file_size):
+
+def build_success_response(*, file_path, document_type, po_number, items, metadata, file_size):
     return PODataParsed(
         file_path=file_path,
         document_type=document_type,
@@ -19,7 +20,7 @@ def build_success_response(file_path, document_type, po_number, items, metadata,
     )
 
 
-def build_failed_response(file_path, document_type=None, file_size=None, exc: Exception = None):
+def build_failed_response(file_path, *, document_type=None, file_size=None, exc: Exception = None):
     logger.error(f"Error while parse file JSON from PDF: {exc}")
     return PODataParsed(
         file_path=file_path,
@@ -29,5 +30,5 @@ def build_failed_response(file_path, document_type=None, file_size=None, exc: Ex
         metadata={},
         step_status=StatusEnum.FAILED,
         messages=[traceback.format_exc()],
-        file_size= file_size or "",
+        file_size=file_size or "",
     )
@@ -23,8 +23,9 @@ class TxtHelper:
             with open(self.file_record.get("file_path"), "r", encoding=self.encoding) as f:
                 return f.read()
         else:
-            self.file_record.get("object_buffer").seek(0)
-            return self.file_record.get("object_buffer").read().decode(self.encoding)
+            # Decode straight from the BytesIO buffer so the raw bytes are not copied out first
+            with self.file_record.get("object_buffer").getbuffer() as view:
+                return str(view, self.encoding)
 
     def parse_file_to_json(self, parse_func) -> PODataParsed:
         """
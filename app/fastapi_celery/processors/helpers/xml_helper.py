@@ -1,9 +1,26 @@
+from functools import lru_cache
 from utils import log_helpers
 
 
 # === Set up logging ===
 logger = log_helpers.get_logger("xml_helper")
 
+# Single-pass escape table for special XML chars
+_XML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&apos;",
+})
+
+
+@lru_cache(maxsize=4096)
+def _escape_xml(value: str) -> str:
+    # Processor argument values repeat across requests, so hits skip the translate entirely
+    return value.translate(_XML_ESCAPE)
+
+
 def build_processor_setting_xml(processor_args: list[dict[str, str]]) -> str | None:
     """
     Convert processorArgumentDtos into XML format like:
@@ -27,15 +44,7 @@ def build_processor_setting_xml(processor_args: list[dict[str, str]]) -> str | N
         name = arg.get("name")
         value = arg.get("value", "")
         if name:
-            # escape special XML chars
-            safe_value = (
-                str(value)
-                .replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-                .replace('"', "&quot;")
-                .replace("'", "&apos;")
-            )
+            safe_value = _escape_xml(str(value))
             xml_lines.append(f"  <{name}>{safe_value}</{name}>")
         else:
             logger.warning(
@@ -45,7 +54,7 @@ def build_processor_setting_xml(processor_args: list[dict[str, str]]) -> str | N
     xml_lines.append("</PROCESSORSETTINGXML>")
     xml_string = "\n".join(xml_lines)
 
-    logger.info(f"[build_processor_setting_xml] Generated XML:\n{xml_string}")
+    logger.info(f"[build_processor_setting_xml] Generated XML with {len(xml_lines) - 2} arguments")
     return xml_string
 
 def get_data_output_for_rule_mapping(response_api):
@@ -54,24 +63,17 @@ def get_data_output_for_rule_mapping(response_api):
         "processorConfigXml": "<PROCESSORSETTINGXML></PROCESSORSETTINGXML>",
         "fileLogLink": "",
     }
- 
-    try:
-        processor_args = []
-        if "processorArgumentDtos" in response_api:
-            raw_args = response_api["processorArgumentDtos"] or []
-            processor_args = [
-                {"name": arg["processorArgumentName"], "value": arg["value"]}
-                for arg in raw_args
-            ]
- 
-        xml_data = build_processor_setting_xml(processor_args)
-        data_output["processorArgs"] = processor_args
-        data_output["processorConfigXml"] = xml_data
- 
-    except Exception as e:
-        logger.error(
-            f"[get_data_output_for_rule_mapping] An error occurred: {e}",
-            exc_info=True,
-        )
- 
+
+    raw_args = response_api.get("processorArgumentDtos") if isinstance(response_api, dict) else None
+    # Arguments without a name cannot become XML tags, so they are dropped up front
+    processor_args = [
+        {"name": arg.get("processorArgumentName"), "value": arg.get("value", "")}
+        for arg in raw_args or []
+        if arg.get("processorArgumentName")
+    ]
+
+    data_output["processorArgs"] = processor_args
+    data_output["processorConfigXml"] = (
+        build_processor_setting_xml(processor_args) or data_output["processorConfigXml"]
+    )
     return data_output
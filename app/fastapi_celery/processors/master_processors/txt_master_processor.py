@@ -65,34 +65,30 @@ class TxtMasterProcessor:
             with open(self.file_record.get("file_path"), "r", encoding="utf-8") as f:
                 return f.read()
         else:
-            self.file_record.get("object_buffer").seek(0)
-            return self.file_record.get("object_buffer").read().decode("utf-8")
+            # Decode straight from the BytesIO buffer so the raw bytes are not copied out first
+            with self.file_record.get("object_buffer").getbuffer() as view:
+                return str(view, "utf-8")
 
     def _parse_text_blocks(self, text: str) -> tuple[dict, dict]:
         headers = {}
         items = {}
 
-        blocks = text.strip().split("# Table: ")
-        for block in blocks:
-            if not block.strip():
-                continue
-
+        for block in text.split("# Table: "):
             lines = block.strip().splitlines()
             if len(lines) < 2:
-                continue  # Invalid block
+                continue  # Empty or invalid block
 
             table_name = lines[0].strip()
             table_headers = [col.strip() for col in lines[1].split("|")]
             headers[table_name] = table_headers
 
-            table_items = []
-            for row in lines[2:]:
-                values = [v.strip() for v in row.split("|")]
-                # Only include rows that match header length
-                if len(values) == len(table_headers):
-                    item = dict(zip(table_headers, values))
-                    table_items.append(item)
-
-            items[table_name] = table_items
+            # Only include rows that match header length; counting separators first
+            # skips the split/strip work for rows that would be dropped anyway
+            separators = len(table_headers) - 1
+            items[table_name] = [
+                dict(zip(table_headers, [v.strip() for v in row.split("|")]))
+                for row in lines[2:]
+                if row.count("|") == separators
+            ]
 
         return headers, items
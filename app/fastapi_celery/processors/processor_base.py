@@ -1,6 +1,7 @@
-import types
 import importlib
 import inspect
+from typing import Callable
+from models.class_models import FileRecord
 from models.tracking_models import TrackingModel
 from processors.processor_nodes import WORKFLOW_PROCESSORS
 from utils import log_helpers
@@ -14,10 +15,20 @@ class ProcessorBase:
     """
     Base class for workflow processors.
 
-    Dynamically loads and binds all processing functions defined in
-    `processors.workflow_processors`.
+    Dynamically loads all processing functions defined in
+    `processors.workflow_processors` and exposes them as methods.
     """
 
+    # (name, function) pairs discovered once per process
+    _workflow_functions: list[tuple[str, Callable]] | None = None
+    # Subclass carrying those functions as regular methods, built on first use
+    _workflow_class: type | None = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls is ProcessorBase:
+            cls = cls._build_workflow_class()
+        return super().__new__(cls)
+
     def __init__(self, tracking_model: TrackingModel):
         """
         Initialize the processor with a tracking model.
@@ -26,32 +37,55 @@ class ProcessorBase:
             tracking_model (TrackingModel): Model for tracking and logging workflow status.
         """
         self.tracking_model = tracking_model
-        self.file_record = {}
-        self._register_workflow_processors()
+        self.file_record: FileRecord = {}
 
     def run(self):
         """Execute the default entry process."""
         self.extract_metadata()
 
-    def _register_workflow_processors(self) -> None:
+    @classmethod
+    def _discover_workflow_processors(cls) -> list[tuple[str, Callable]]:
         """
-        Dynamically register workflow processor functions as instance methods.
+        Import each module listed in `WORKFLOW_PROCESSORS` and collect its functions.
 
-        Imports each module listed in `WORKFLOW_PROCESSORS` from
-        `processors.workflow_processors` and binds their functions to the instance.
+        The result is cached on the class, so the imports and namespace scan
+        run only for the first processor created in the process.
         Logs a warning if a module is missing.
         """
+        if cls._workflow_functions is not None:
+            return cls._workflow_functions
+
         base_modules = {"workflow_processors": "processors.workflow_processors"}
+        functions = []
 
         for module_name in WORKFLOW_PROCESSORS:
             try:
                 module_path = f"{base_modules['workflow_processors']}.{module_name}"
                 module = importlib.import_module(module_path)
 
-                for name, func in inspect.getmembers(module):
+                for name, func in vars(module).items():
                     if inspect.isfunction(func) or inspect.iscoroutinefunction(func):
-                        setattr(self, name, types.MethodType(func, self))
+                        functions.append((name, func))
                         logger.debug(f"Registered processor: {name} from {module_name}")
 
             except ModuleNotFoundError:
                 logger.warning(f"Module not found: {module_name}")
+
+        ProcessorBase._workflow_functions = functions
+        return functions
+
+    @classmethod
+    def _build_workflow_class(cls) -> type:
+        """
+        Return a `ProcessorBase` subclass with the workflow functions as methods.
+
+        Binding happens through the normal method descriptor, so creating a
+        processor no longer builds a bound method per function per instance.
+        """
+        if ProcessorBase._workflow_class is None:
+            ProcessorBase._workflow_class = type(
+                "ProcessorBase",
+                (ProcessorBase,),
+                dict(cls._discover_workflow_processors()),
+            )
+        return ProcessorBase._workflow_class
@@ -10,7 +10,7 @@ class ProcessorRegistry:
     Registry for resolving processor templates by backend template code
     """
 
-    code_to_processor: dict[str, type[ProcessorTemplate]] = {
+    template_by_code: dict[str, ProcessorTemplate] = {
         # PO templates
         "TXT_001_TEMPLATE": ProcessorTemplate.TXT_001_TEMPLATE,
         "TXT_002_TEMPLATE": ProcessorTemplate.TXT_002_TEMPLATE,
@@ -38,9 +38,14 @@ class ProcessorRegistry:
         "EXCEL_MASTERDATA_TEMPLATE": ProcessorTemplate.EXCEL_MASTERADATA_TEMPLATE,
     }
 
+    # Resolved once at import so the per-file lookup returns the processor class directly
+    code_to_processor: dict[str, type] = {
+        code: template.value.cls for code, template in template_by_code.items()
+    }
+
     @classmethod
-    def get_processor_for_file(cls, template_code: str) -> type[ProcessorTemplate] | None:
+    def get_processor_for_file(cls, template_code: str) -> type | None:
         """
-        Return the processor template class for the given template code
+        Return the processor class for the given template code
         """
         return cls.code_to_processor.get(template_code)
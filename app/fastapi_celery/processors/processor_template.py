@@ -1,10 +1,11 @@
 from enum import Enum
+from functools import cached_property
 from typing import Type
 from dataclasses import dataclass
 from processors import file_processors, master_processors
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProcessorMeta:
     """
     Metadata for a processor.
@@ -42,9 +43,14 @@ class ProcessorTemplate(Enum):
         """Return the processor description."""
         return self.value.description
 
+    @cached_property
+    def _repr(self) -> str:
+        # Members are singletons, so the string is built once per template
+        return f"{self.name} ({self.value.input_type} → {self.value.output_type})"
+
     def __repr__(self) -> str:
         """Return string representation: 'NAME (input_type → output_type)'."""
-        return f"{self.name} ({self.input_type} → {self.output_type})"
+        return self._repr
 
     # ======================================================== #
     # === Template registry for file processors === #
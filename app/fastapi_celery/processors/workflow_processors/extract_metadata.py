@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from models.class_models import FileRecord
 from utils import ext_extraction
 
 
@@ -6,7 +7,7 @@ def extract_metadata(self) -> None:
     """Extracts file metadata and stores it in [self.file_record]"""
 
     file_processor = ext_extraction.FileExtensionProcessor(self.tracking_model)
-    self.file_record = {
+    self.file_record: FileRecord = {
         "file_path": file_processor.file_path,
         "file_path_parent": file_processor.file_path_parent,
         "source_type": file_processor.source_type,
@@ -23,8 +23,8 @@ def parse_file_to_json(self: ProcessorBase, data_input, schema_object, response_
         template_info = response_api[0].get("templateFileParse", {})
         template_code = template_info.get("code")
 
-        processor_enum = ProcessorRegistry.get_processor_for_file(template_code)
-        processor_instance = processor_enum.create_instance(self.file_record)
+        processor_cls = ProcessorRegistry.get_processor_for_file(template_code)
+        processor_instance = processor_cls(self.file_record)
         data = processor_instance.parse_file_to_json()
 
         data_output["totalRecords"] = len(data.items)
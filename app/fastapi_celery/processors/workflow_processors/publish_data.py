@@ -11,7 +11,6 @@ def publish_data(self: ProcessorBase, data_input, schema_object, response_api, *
     This method evaluates the response from an external publish API call, constructs
     a data output payload, and returns a StepOutput indicating success or failure.
     """
-    # This method is currently empty. It will be implemented in the future
     if ALLOW_TEST_SLEEP and SLEEP_DURATION >0: # NOSONAR
         time.sleep(SLEEP_DURATION)
 
@@ -20,8 +19,7 @@ def publish_data(self: ProcessorBase, data_input, schema_object, response_api, *
     data_output = build_publish_data_output(kwargs.get("connectionDto"))
 
     logger.info("data_output_log",extra={ "data_output": data_output})
-    
-    data = None
+
     try:
 
         if not response_api:
@@ -87,7 +85,7 @@ def copy_file(self: ProcessorBase, data_input, response_api, *args, **kwargs) ->
 
         # --- get file name from file_ouput ---
         file_output = data_input.data.file_output
-        file_name = file_output.strip("/").split("/")[-1]
+        file_name = file_output.rstrip("/").rpartition("/")[2]
         dest_key = f"{s3_key_prefix}{file_name}"
 
         # --- copy file---
@@ -1,5 +1,4 @@
 import json
-import pandas as pd
 from models.class_models import StatusEnum, StepOutput
 from models.tracking_models import ServiceLog, LogType
 from processors.processor_base import ProcessorBase, logger
@@ -13,7 +12,7 @@ FAILED_PARSE_API_MSG = "Failed to call template-parse API"
 def template_data_mapping(self: ProcessorBase, data_input, schema_object, response_api, *args, **kwargs) -> StepOutput: # NOSONAR
     """
     Perform data mapping based on template mapping configuration.
-    This step renames and reorders dataframe columns according to the mapping API response.
+    This step renames and reorders the item keys according to the mapping API response.
     """
     if ALLOW_TEST_SLEEP and SLEEP_DURATION >0: # NOSONAR
         time.sleep(SLEEP_DURATION)
@@ -26,8 +25,7 @@ def template_data_mapping(self: ProcessorBase, data_input, schema_object, respon
     }
         
     try:
-        # Convert items to DataFrame
-        df = pd.DataFrame(data_input.data.items)
+        items = data_input.data.items
 
         if not response_api or "templateMappingHeaders" not in response_api:
             raise RuntimeError(f"Mapping API did not return a valid response: {response_api}")
@@ -36,23 +34,26 @@ def template_data_mapping(self: ProcessorBase, data_input, schema_object, respon
             response_api["templateMappingHeaders"], key=lambda x: x["order"]
         )
 
-        # Validate expected headers from API vs actual DataFrame columns
-        expected_headers = [
-            m["fromHeader"]
-            for m in headers_sorted
-            if m.get("fromHeader") not in (None, "Unmapping")
-        ]
-        missing_headers = [h for h in expected_headers if h not in df.columns]
+        # Columns in first-seen order across all rows, as a DataFrame would build them
+        columns = dict.fromkeys(key for row in items for key in row)
+
+        # One pass over the headers builds the mapping dictionary (only map when
+        # fromHeader is valid and present) and validates expected headers from API
+        # vs actual input columns
         number = 0
-        # Build mapping dictionary: only map when fromHeader is valid and different from header
         mapping_dict = {}
+        null_headers = set()
+        missing_headers = []
         for m in headers_sorted:
             from_col = m.get("fromHeader")
             to_col = m.get("header")
-            if from_col and from_col in df.columns:
+            if from_col and from_col in columns:
                 mapping_dict[from_col] = to_col
             elif not from_col:
                 number +=1
+                null_headers.add(to_col)
+            if from_col not in (None, "Unmapping") and from_col not in columns:
+                missing_headers.append(from_col)
 
         data_output.update(
             {
@@ -62,22 +63,26 @@ def template_data_mapping(self: ProcessorBase, data_input, schema_object, respon
             }
         )
 
-        df = df.rename(columns=mapping_dict)
-
-        for m in headers_sorted:
-            from_col = m.get("fromHeader")
-            to_col = m.get("header")
-
-            if not from_col:
-                df[to_col] = None
+        # Output header -> source key; unmapped input columns keep their own name
+        sources = {mapping_dict.get(col, col): col for col in columns}
 
         # Reorder to match header order from API
-        ordered_headers = [m["header"] for m in headers_sorted if m.get("header") in df.columns]
-        df = df[ordered_headers]
-        # Step 7: Return success output
-        updated_output = data_input.data.model_copy(
-            update={"items": df.to_dict(orient="records")}
-        )
+        ordered_headers = list(dict.fromkeys(
+            m["header"] for m in headers_sorted
+            if m.get("header") in sources or m.get("header") in null_headers
+        ))
+        # Rename and reorder in one pass over the rows; values are never transformed,
+        # so there is no need to round-trip through a DataFrame
+        plan = [
+            (header, None if header in null_headers else sources[header])
+            for header in ordered_headers
+        ]
+        # With no output columns at all the DataFrame version produced no records,
+        # not one empty record per row
+        records = [
+            {header: row.get(src) if src is not None else None for header, src in plan}
+            for row in items
+        ] if plan else []
 
         if missing_headers:
             error_msg = (
@@ -87,7 +92,7 @@ def template_data_mapping(self: ProcessorBase, data_input, schema_object, respon
             return StepOutput(
                 data=data_input.data.model_copy(
                     update={
-                        "items": df.to_dict(orient="records"),
+                        "items": records,
                         "step_status": StatusEnum.FAILED,
                         "messages": [error_msg]
                     }
@@ -97,8 +102,9 @@ def template_data_mapping(self: ProcessorBase, data_input, schema_object, respon
                 step_failure_message=[error_msg],
             )
 
+        # Step 7: Return success output
         return StepOutput(
-            data=updated_output,
+            data=data_input.data.model_copy(update={"items": records}),
             sub_data={"data_output": data_output},
             step_status=StatusEnum.SUCCESS,
             step_failure_message=None,
@@ -12,6 +12,9 @@ from processors.processor_base import ProcessorBase, logger
 from config_loader import ALLOW_TEST_SLEEP, SLEEP_DURATION
 import time
 
+_NUMBER_RE = re.compile(r"-?\d+(\.\d+)?")
+
+
 class TemplateValidation:
     """
     Validates PO data against the schema definition returned by API
@@ -21,58 +24,99 @@ class TemplateValidation:
         self.tracking_model = tracking_model
         self.items = po_json.items if isinstance(po_json.items, list) else [po_json.items]
 
-    def _check_required(self, val: Any, required: bool, allow_empty: bool, col_key: str, idx: int) -> str | None:
-        if required and not allow_empty and (val is None or str(val).strip() == ""):
+    def _check_required(self, is_blank: bool, required: bool, allow_empty: bool, col_key: str, idx: int) -> str | None:
+        if required and not allow_empty and is_blank:
             return f"Row {idx}: '{col_key}' is required but empty"
         return None
  
-    def _check_max_length(self, val: Any, max_length: int | None, col_key: str, idx: int) -> str | None:
-        if max_length and len(str(val)) > int(max_length):
+    def _check_max_length(self, sval: str, max_length: int | None, col_key: str, idx: int) -> str | None:
+        if max_length and len(sval) > int(max_length):
             return f"Row {idx}: '{col_key}' exceeds maxLength {max_length}"
         return None
  
-    def _check_regex(self, val: Any, regex: str | None, col_key: str, idx: int) -> str | None:
-        if regex and not re.fullmatch(regex, str(val)):
-            return f"Row {idx}: '{col_key}'='{val}' does not match regex {regex}"
+    def _check_regex(self, sval: str, pattern: re.Pattern | None, col_key: str, idx: int) -> str | None:
+        if pattern and not pattern.fullmatch(sval):
+            return f"Row {idx}: '{col_key}'='{sval}' does not match regex {pattern.pattern}"
         return None
  
-    def _check_dtype(self, val: Any, dtype: str | None, col_key: str, idx: int) -> str | None:
-        if dtype == "Number" and not re.fullmatch(r"-?\d+(\.\d+)?", str(val)):
-            return f"Row {idx}: '{col_key}'='{val}' is not a valid number"
-        if dtype == "Date":
-            try:
-                pd.to_datetime(val, errors="raise")
-            except Exception:
-                return f"Row {idx}: '{col_key}'='{val}' is not a valid date"
+    def _check_dtype(self, sval: str, dtype: str | None, invalid_dates: set[int], col_key: str, idx: int) -> str | None:
+        if dtype == "Number" and not _NUMBER_RE.fullmatch(sval):
+            return f"Row {idx}: '{col_key}'='{sval}' is not a valid number"
+        if dtype == "Date" and idx in invalid_dates:
+            return f"Row {idx}: '{col_key}'='{sval}' is not a valid date"
         return None
+
+    def _find_invalid_dates(self, col_key: str) -> set[int]:
+        """
+        Parse a whole Date column in one call and return the row numbers that fail.
+        """
+        series = pd.Series([row.get(col_key) for row in self.items], dtype=object)
+        try:
+            # format="mixed" parses each value on its own, utc=True allows mixed offsets
+            parsed = pd.to_datetime(series, errors="coerce", format="mixed", utc=True)
+        except Exception:
+            return {
+                idx for idx, val in enumerate(series, start=2)
+                if not self._parses_as_date(val)
+            }
+        # Missing values come back as NaT too, and so do strings like "nan"/"NaT"
+        # that the per-cell parse accepts; re-check those cells one by one
+        bad = parsed.isna() & series.notna()
+        return {
+            int(pos) + 2 for pos in bad.to_numpy().nonzero()[0]
+            if not self._parses_as_date(series.iat[pos])
+        }
+
+    @staticmethod
+    def _parses_as_date(val: Any) -> bool:
+        try:
+            pd.to_datetime(val, errors="raise")
+        except Exception:
+            return False
+        return True
  
-    def _validate_cell(self, val: Any, col_def: dict[str, Any], col_key: str, idx: int) -> tuple[list[str], bool]:
+    def _compile_column(self, col_def: dict[str, Any]) -> dict[str, Any]:
+        """Parse a column's metadata and compile its regex once, before the row loop."""
         metadata = json.loads(col_def.get("metadata", "{}"))
+        regex = metadata.get("regex")
+        return {
+            "required": metadata.get("required", False),
+            "allow_empty": metadata.get("allowEmpty", True),
+            "max_length": metadata.get("maxLength"),
+            "pattern": re.compile(regex) if regex else None,
+            "dtype": col_def.get("dataType"),
+        }
+
+    def _validate_cell(self, val: Any, rules: dict[str, Any], col_key: str, idx: int) -> tuple[list[str], bool]:
         errors = []
         is_error = False
 
+        # Stringify once; every check below works on the same text
+        sval = val if isinstance(val, str) else str(val)
+        is_blank = val is None or sval.strip() == ""
+
         # Required check
-        err = self._check_required(val, metadata.get("required", False), metadata.get("allowEmpty", True), col_key, idx)
+        err = self._check_required(is_blank, rules["required"], rules["allow_empty"], col_key, idx)
         if err:
             is_error = True
             errors.append(err)
             return errors, is_error 
 
-        if val is None or str(val).strip() == "":
+        if is_blank:
             return errors, is_error 
 
         # Max length check
-        if (err := self._check_max_length(val, metadata.get("maxLength"), col_key, idx)):
+        if (err := self._check_max_length(sval, rules["max_length"], col_key, idx)):
             is_error = True
             errors.append(err)
 
         # Regex check
-        if (err := self._check_regex(val, metadata.get("regex"), col_key, idx)):
+        if (err := self._check_regex(sval, rules["pattern"], col_key, idx)):
             is_error = True
             errors.append(err)
 
         # Data type check
-        if (err := self._check_dtype(val, col_def.get("dataType"), col_key, idx)):
+        if (err := self._check_dtype(sval, rules["dtype"], rules["invalid_dates"], col_key, idx)):
             is_error = True
             errors.append(err)
 
@@ -88,24 +132,29 @@ class TemplateValidation:
 
         df_columns = list(self.items[0].keys()) if self.items else []
 
+        # Resolve and compile every usable schema column before touching any row
+        columns = []
         for col_def in schema_columns:
             order = col_def.get("order")
-            if not order or not isinstance(order, int):
-                continue  
+            if not isinstance(order, int) or not 0 < order <= len(df_columns):
+                continue
 
-            col_index = order - 1
-            if col_index >= len(df_columns):
-                continue  
-
-            col_key = df_columns[col_index]  
+            col_key = df_columns[order - 1]
+            rules = self._compile_column(col_def)
+            rules["invalid_dates"] = (
+                self._find_invalid_dates(col_key) if rules["dtype"] == "Date" else set()
+            )
+            columns.append((col_key, rules))
 
+        # Column by column, so messages stay grouped per column
+        for col_key, rules in columns:
             for idx, row in enumerate(self.items, start=2):
                 val = row.get(col_key)
-                list_error, is_error = self._validate_cell(val, col_def, col_key, idx)
+                list_error, is_error = self._validate_cell(val, rules, col_key, idx)
                 if is_error:
                     error_rows.add(idx)
                 errors.extend(list_error)
-        
+
         error_records = len(error_rows)
         valid_records = total_records - error_records
 
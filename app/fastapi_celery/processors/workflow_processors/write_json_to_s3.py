@@ -1,4 +1,3 @@
-import traceback
 from models.class_models import (
     StatusEnum,
     StepOutput,
@@ -39,14 +38,12 @@ def write_json_to_s3(self: ProcessorBase, step_result, s3_key_prefix: str) -> St
         )
 
     except Exception as e:
-        full_tb = traceback.format_exception(type(e), e, e.__traceback__)
         logger.error(
             "[write_json_to_s3] Failed to write JSON to S3.",
             extra={
                 "service": ServiceLog.FILE_STORAGE,
                 "log_type": LogType.ERROR,
                 "data": self.tracking_model,
-                "traceback": full_tb,
             },
             exc_info=True,
         )
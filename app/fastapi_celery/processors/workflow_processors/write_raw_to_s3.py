@@ -1,11 +1,13 @@
-import re
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 from utils.bucket_helper import get_s3_key_prefix
 from processors.processor_base import ProcessorBase, logger
 from models.class_models import StepOutput, StatusEnum
 from models.tracking_models import ServiceLog, LogType
 from utils import read_n_write_s3
 
+# S3 calls block on the network with the GIL released, so independent copies can overlap
+_s3_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="write-raw-s3")
+
 
 def write_raw_to_s3(self: ProcessorBase) -> StepOutput:
     """
@@ -18,44 +20,50 @@ def write_raw_to_s3(self: ProcessorBase) -> StepOutput:
         file_name_wo_ext = self.file_record.get("file_name_wo_ext")
         s3_key_prefix = f"master_data/{file_name_wo_ext}/{file_name}"
 
-        # === Copy file from raw → target bucket ===
-        result = read_n_write_s3.copy_object_between_buckets(
+        # === Copy file from raw → target bucket (runs while the version is resolved) ===
+        target_copy = _s3_executor.submit(
+            read_n_write_s3.copy_object_between_buckets,
             source_bucket=self.file_record.get("raw_bucket_name"),
             source_key=self.file_record.get("file_path"),
             dest_bucket=self.file_record.get("target_bucket_name"),
             dest_key=s3_key_prefix,
         )
 
-        # === Determine next version number ===
-        version_prefix = f"versioning/{file_name_wo_ext}/"
-        existing_keys = read_n_write_s3.list_objects_with_prefix(
-            bucket_name=self.file_record.get("target_bucket_name"),
-            prefix=version_prefix,
-        )
+        try:
+            # === Determine next version number ===
+            version_prefix = f"versioning/{file_name_wo_ext}/"
+            # Only the NNN/ folders are listed, not every object inside them
+            version_folders = read_n_write_s3.list_common_prefixes(
+                bucket_name=self.file_record.get("target_bucket_name"),
+                prefix=version_prefix,
+            )
 
-        version_number = 1
-        if existing_keys:
+            version_number = 1
             numbers = []
-            for key in existing_keys:
-                match = re.search(
-                    rf"versioning/{re.escape(file_name_wo_ext)}/(\d{{3}})/",
-                    key,
-                )
-                if match:
-                    numbers.append(int(match.group(1)))
+            for folder in version_folders:
+                segment = folder[len(version_prefix):].rstrip("/")
+                if len(segment) == 3 and segment.isdigit():
+                    numbers.append(int(segment))
             if numbers:
                 version_number = max(numbers) + 1
 
-        version_folder = f"{version_number:03d}"
-        version_key = f"{version_prefix}{version_folder}/{file_name}"
+            version_folder = f"{version_number:03d}"
+            version_key = f"{version_prefix}{version_folder}/{file_name}"
 
-        # === Copy file to versioning folder ===
-        read_n_write_s3.copy_object_between_buckets(
-            source_bucket=self.file_record.get("raw_bucket_name"),
-            source_key=self.file_record.get("file_path"),
-            dest_bucket=self.file_record.get("target_bucket_name"),
-            dest_key=version_key,
-        )
+            # === Copy file to versioning folder ===
+            read_n_write_s3.copy_object_between_buckets(
+                source_bucket=self.file_record.get("raw_bucket_name"),
+                source_key=self.file_record.get("file_path"),
+                dest_bucket=self.file_record.get("target_bucket_name"),
+                dest_key=version_key,
+            )
+        except Exception:
+            # Do not leave the target copy running, or its error unseen, once the step fails
+            if not target_copy.cancel():
+                target_copy.result()
+            raise
+
+        result = target_copy.result()
 
         # === Log success ===
         logger.info(
@@ -77,14 +85,12 @@ def write_raw_to_s3(self: ProcessorBase) -> StepOutput:
         )
 
     except Exception as e:
-        full_tb = traceback.format_exception(type(e), e, e.__traceback__)
         logger.error(
             f"[write_raw_to_s3] Failed to copy raw file to S3: {e}",
             extra={
                 "service": ServiceLog.FILE_STORAGE,
                 "log_type": LogType.ERROR,
                 "data": self.tracking_model,
-                "traceback": full_tb,
             },
             exc_info=True,
         )
@@ -1,7 +1,9 @@
 import json
+import asyncio
 import traceback
 from dataclasses import asdict
 from fastapi import APIRouter, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from utils import read_n_write_s3
 from utils.bucket_helper import get_s3_key_prefix
@@ -33,6 +35,11 @@ DISABLE_STOP_TASK_ENDPOINT = False  # Currently, disable stop_task endpoint
 router = APIRouter()
 
 
+def _request_id(http_request: Request) -> str:
+    """Return the request id set by the middleware, generating a UUID only when it is missing."""
+    return getattr(http_request.state, "request_id", None) or str(uuid4())
+
+
 @router.post("/file/process", summary="Process file and log task result")
 async def process_file(data: FilePathRequest, http_request: Request) -> Dict[str, str]:
     """
@@ -59,17 +66,14 @@ async def process_file(data: FilePathRequest, http_request: Request) -> Dict[str
     try:
         # If run for the first time, it will create request_id (celery_id)
         # If run again, it will reuse request_id (celery_id)
-        is_cancel = False
-        if data.is_cancel:
-            is_cancel = str(data.is_cancel).strip().lower() in ("True", "true", "1")
-            new_celery_id = getattr(http_request.state, "request_id", str(uuid4()))
+        is_cancel = bool(data.is_cancel) and str(data.is_cancel).strip().lower() in ("true", "1")
 
         if not (data.celery_id and data.celery_id.strip()):
-            data.celery_id = getattr(http_request.state, "request_id", str(uuid4()))
+            data.celery_id = _request_id(http_request)
 
         celery_task.task_execute.apply_async(
             kwargs={"data": data.model_dump()},
-            task_id=new_celery_id if is_cancel else data.celery_id,
+            task_id=_request_id(http_request) if is_cancel else data.celery_id,
         )
         
         logger.info(
@@ -86,15 +90,12 @@ async def process_file(data: FilePathRequest, http_request: Request) -> Dict[str
         }
 
     except Exception as e:
-        traceback.print_exc()
-        full_tb = traceback.format_exception(type(e), e, e.__traceback__)
         logger.exception(
             "Submitted Celery task failed.",
             extra={
                 "service": ServiceLog.API_GATEWAY,
                 "log_type": LogType.ERROR,
                 "data": data,
-                "traceback": full_tb,
             },
         )
         raise HTTPException(
@@ -132,8 +133,7 @@ async def stop(data: StopTaskRequest) -> Dict[str, Any]:
     reason = data.reason or "Stopped manually by user"
 
     celery_task = redis_connector.get_celery_task(celery_id)
-    steps = redis_connector.get_all_steps_for_task(celery_id)
-    
+
     if not celery_task:
         logger.warning(
             f"Workflow not found for task_id: {celery_id}",
@@ -162,8 +162,11 @@ async def stop(data: StopTaskRequest) -> Dict[str, Any]:
             },
         )
         
-    # Kill the running process
-    celery_app.control.revoke(celery_id, terminate=True, signal="SIGKILL")
+    # Only scan the step keys once the task is known to be stoppable
+    steps = redis_connector.get_all_steps_for_task(celery_id)
+
+    # Kill the running process; publishing the broadcast blocks on the broker
+    await run_in_threadpool(celery_app.control.revoke, celery_id, terminate=True, signal="SIGKILL")
     logger.info(
         f"Revoked Celery task {celery_id} with reason: {reason}",
         extra={
@@ -194,6 +197,7 @@ async def stop(data: StopTaskRequest) -> Dict[str, Any]:
         target_bucket_name = file_record["target_bucket_name"]
         s3_key_prefix = None
         
+        pending_finishes = []
         for step_id, step_data in steps.items():
             if step_data["status"] == "PROCESSING":
                 step = WorkflowStep(**step_data["step"])
@@ -215,15 +219,21 @@ async def stop(data: StopTaskRequest) -> Dict[str, Any]:
                     message=f"Step [{step_name}] was manually canceled by the user",
                     dataOutput=tmp_data_output,
                 ))
-                    
-                finish_step_connector = BEConnector(ApiUrl.WORKFLOW_STEP_FINISH.full_url(), body_data=body_data)
-                finish_step_response = await finish_step_connector.post()
-                logger.info(f"finish_step_response_log: [{finish_step_response}]")
+                pending_finishes.append((step, body_data))
+
+        # The step-finish calls are independent, so they are sent together
+        finish_step_responses = await asyncio.gather(*(
+            BEConnector(ApiUrl.WORKFLOW_STEP_FINISH.full_url(), body_data=body_data).post()
+            for _, body_data in pending_finishes
+        ))
 
-                context_data.step_detail[step.stepOrder].metadata_api.Step_finish_api.url = ApiUrl.WORKFLOW_STEP_FINISH.full_url()
-                context_data.step_detail[step.stepOrder].metadata_api.Step_finish_api.method = "POST"
-                context_data.step_detail[step.stepOrder].metadata_api.Step_finish_api.request = body_data
-                context_data.step_detail[step.stepOrder].metadata_api.Step_finish_api.response = finish_step_response
+        for (step, body_data), finish_step_response in zip(pending_finishes, finish_step_responses):
+            logger.info(f"finish_step_response_log: [{finish_step_response}]")
+
+            context_data.step_detail[step.stepOrder].metadata_api.Step_finish_api.url = ApiUrl.WORKFLOW_STEP_FINISH.full_url()
+            context_data.step_detail[step.stepOrder].metadata_api.Step_finish_api.method = "POST"
+            context_data.step_detail[step.stepOrder].metadata_api.Step_finish_api.request = body_data
+            context_data.step_detail[step.stepOrder].metadata_api.Step_finish_api.response = finish_step_response
 
         # Update session status to CANCEL
         body_data = asdict(WorkflowSessionFinishBody(
@@ -241,21 +251,8 @@ async def stop(data: StopTaskRequest) -> Dict[str, Any]:
         context_data.workflow_detail.metadata_api.session_finish_api.request = body_data
         context_data.workflow_detail.metadata_api.session_finish_api.response = session_response
 
-        # Convert context objects to plain dicts for schema compatibility
-        step_detail_dump = None
-        if context_data.step_detail is not None:
-            step_detail_dump = [
-                (sd.model_dump() if hasattr(sd, "model_dump") else sd)
-                for sd in context_data.step_detail
-            ]
-
-        workflow_detail_dump = None
-        if context_data.workflow_detail is not None:
-            workflow_detail_dump = (
-                context_data.workflow_detail.model_dump()
-                if hasattr(context_data.workflow_detail, "model_dump")
-                else context_data.workflow_detail
-            )
+        # Convert context objects to plain dicts for schema compatibility (one pydantic-core pass)
+        context_dump = context_data.model_dump(include={"step_detail", "workflow_detail"})
 
         schema_object = PODataParsed(
             file_path=file_record["file_path"],
@@ -266,8 +263,8 @@ async def stop(data: StopTaskRequest) -> Dict[str, Any]:
             step_status=StatusEnum.CANCEL,
             messages=[f"Revoked Celery task {celery_id} with reason: {reason}"],
             file_size=file_record["file_size"],
-            step_detail=step_detail_dump,
-            workflow_detail=workflow_detail_dump,
+            step_detail=context_dump["step_detail"],
+            workflow_detail=context_dump["workflow_detail"],
             json_output=s3_key_prefix
         )
 
@@ -278,7 +275,9 @@ async def stop(data: StopTaskRequest) -> Dict[str, Any]:
             step_failure_message=[f"Revoked Celery task {celery_id} with reason: {reason}"],
         )
 
-        result = read_n_write_s3.write_json_to_s3(
+        # boto3 blocks; run the upload in the threadpool so the event loop keeps serving
+        result = await run_in_threadpool(
+            read_n_write_s3.write_json_to_s3,
             json_data=step_output,
             bucket_name=target_bucket_name,
             s3_key_prefix=s3_key_prefix,
@@ -303,15 +302,14 @@ async def stop(data: StopTaskRequest) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        full_tb = traceback.format_exception(type(e), e, e.__traceback__)
         logger.error(
             f"Failed to stop task {celery_id}!\n",
             extra={
                 "service": ServiceLog.API_GATEWAY,
                 "log_type": LogType.ERROR,
                 "traceability": celery_id,
-                "traceback": full_tb,
             },
+            exc_info=True,
         )
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
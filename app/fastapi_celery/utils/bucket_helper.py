@@ -2,7 +2,7 @@ import config_loader
 from datetime import datetime, timezone
 from processors.processor_nodes import BUCKET_MAP, PROCESS_DEFINITIONS
 from utils.common_utils import get_step_name
-from models.class_models import DocumentType, WorkflowStep
+from models.class_models import DocumentType, FileRecord, WorkflowStep
 from models.tracking_models import TrackingModel
 
 
@@ -53,7 +53,7 @@ def get_bucket_name(
 
 
 def get_s3_key_prefix(
-    file_record: dict,
+    file_record: FileRecord,
     tracking_model: TrackingModel,
     step: WorkflowStep | None = None,
     target_folder: str | None = None,
@@ -61,7 +61,13 @@ def get_s3_key_prefix(
     version_folder: str | None = None,
 ) -> str:
 
-    date_str = datetime.now(timezone.utc).strftime("%Y%m%d")
+    # All steps of a run share the date stamped by extract_metadata, so a run
+    # crossing midnight UTC keeps writing under one date folder
+    proceed_at = file_record.get("proceed_at")
+    if proceed_at:
+        date_str = proceed_at[:10].replace("-", "")
+    else:
+        date_str = datetime.now(timezone.utc).strftime("%Y%m%d")
     step_order = f"{int(step.stepOrder):02}" if step else ""
 
     file_name = file_record.get("file_name")
@@ -1,7 +1,8 @@
 from models.class_models import WorkflowStep
 from utils import log_helpers
 from processors.processor_nodes import PROCESS_DEFINITIONS
-from io import BytesIO
+import csv
+from io import BytesIO, TextIOWrapper
 import pandas as pd
 from pydantic import BaseModel
 
@@ -10,17 +11,15 @@ logger = log_helpers.get_logger("common_utils")
 
 def get_step_name(step_name: str) -> str | None:
     """Return the matching step name from PROCESS_DEFINITIONS."""
-    
-    list_step = list(PROCESS_DEFINITIONS.keys())
 
-    # Case 1: exact match
-    if step_name in list_step:
+    # Case 1: exact match (dict lookup, no scan)
+    if step_name in PROCESS_DEFINITIONS:
         return step_name
 
     # Case 2: match dynamic prefix (e.g., [RULE_MP]_SUBMIT)
-    for step_key in list_step:
+    for step_key in PROCESS_DEFINITIONS:
         if step_key.startswith("[") and "]_" in step_key:
-            suffix = step_key.split("]_")[-1]
+            suffix = step_key.rpartition("]_")[2]
             if step_name.endswith(suffix):
                 logger.info(f"[get_step_name] Dynamic match found for '{step_name}' → '{step_key}'")
                 return step_key
@@ -52,6 +51,29 @@ def reverse_step_name(step_name: str, list_items: list[WorkflowStep]) -> str | N
 
 
 
+def _plain_text_columns(payload) -> list | None:
+    """
+    Return the column names when every row is a dict with the same keys, in the
+    same order, holding only str or None values; otherwise None.
+
+    For such rows `csv.writer` produces exactly what `DataFrame.to_csv` would.
+    Numbers, NaN and ragged rows are left to pandas, whose dtype inference
+    changes how they are written.
+    """
+    if not isinstance(payload, list) or not isinstance(payload[0], dict):
+        return None
+    columns = list(payload[0])
+    if not columns:
+        return None
+    for row in payload:
+        if type(row) is not dict or list(row) != columns:
+            return None
+        for value in row.values():
+            if value is not None and type(value) is not str:
+                return None
+    return columns
+
+
 def get_csv_buffer_file(data_input) -> BytesIO:
     """
     Build CSV from data_input
@@ -79,6 +101,18 @@ def get_csv_buffer_file(data_input) -> BytesIO:
     if payload is None or not isinstance(payload, (list, dict)) or not payload:
         raise ValueError("Empty payload — no data to process for CSV.")
 
+    # --- Fast path: uniform rows of text, written without a DataFrame ---
+    columns = _plain_text_columns(payload)
+    if columns:
+        csv_buffer = BytesIO()
+        text_stream = TextIOWrapper(csv_buffer, encoding="utf-8", newline="", write_through=True)
+        writer = csv.writer(text_stream, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(row.values() for row in payload)
+        text_stream.detach()
+        csv_buffer.seek(0)
+        return csv_buffer
+
     # --- Convert to DataFrame ---
     df = pd.DataFrame(payload)
     if df.empty:
@@ -1,8 +1,16 @@
 import os
+import queue
+import atexit
+import copy
 import dataclasses
+import functools
 import logging
 import logging.config
-from typing import Any, Dict
+import logging.handlers
+import operator
+from typing import Any, Callable, Dict
+import ecs_logging
+import orjson
 from enum import Enum
 from pydantic import BaseModel
 from models.tracking_models import LogType, ServiceLog
@@ -28,50 +36,205 @@ EXCLUDED_FIELDS = [
 # Determine environment and log level
 ENV = config_loader.get_config_value("environment", "env") or "dev"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG" if ENV == "dev" else "INFO")
+CONSOLE_LOG_LEVEL = "INFO"
+# The console handler drops anything below CONSOLE_LOG_LEVEL, so loggers are
+# gated there too and the adapter never normalizes records nobody will see
+LOGGER_LEVEL = max(logging.getLevelName(LOG_LEVEL), logging.getLevelName(CONSOLE_LOG_LEVEL))
+
+
+# =========================
+# Background console writer
+# =========================
+# Attributes every LogRecord carries; anything else on a record came from `extra`
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
+class EcsQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that keeps exc_info/stack_info on the record, so the ECS
+    formatter on the listener thread still emits error.stack_trace.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now; they may be mutated by the caller before the listener runs
+        record.msg = record.getMessage()
+        record.args = None
+        # Same for dict/list extras: the listener formats them later, so it gets
+        # its own top-level copy rather than the caller's live container
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and type(value) in (dict, list):
+                record.__dict__[key] = value.copy()
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if _listener_running:
+            super().emit(record)
+        else:
+            # Listener already stopped (process shutting down): write inline
+            _console_handler.handle(record)
+
+
+class OrjsonEcsFormatter(ecs_logging.StdlibFormatter):
+    """
+    ECS formatter that keeps ecs_logging's field mapping but encodes with orjson.
+
+    The layout matches ecs_logging: '@timestamp', 'log.level' and 'message'
+    first, then the remaining fields with sorted keys.
+    """
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def format(self, record: logging.LogRecord) -> str:
+        result = self.format_to_ecs(record)
+        head = {}
+        if "@timestamp" in result:
+            head["@timestamp"] = result.pop("@timestamp")
+        log_fields = result.get("log")
+        if isinstance(log_fields, dict) and "level" in log_fields:
+            head["log.level"] = log_fields.pop("level")
+            if not log_fields:
+                result.pop("log")
+        elif "log.level" in result:
+            head["log.level"] = result.pop("log.level")
+        if "message" in result:
+            head["message"] = result.pop("message")
+
+        try:
+            head_json = orjson.dumps(head, default=repr, option=self._OPTIONS)
+            if not result:
+                return head_json.decode()
+            rest_json = orjson.dumps(result, default=repr, option=self._OPTIONS | orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # e.g. integers wider than 64 bits; let ecs_logging build and encode it
+            return super().format(record)
+        if not head:
+            return rest_json.decode()
+        return (head_json[:-1] + b"," + rest_json[1:]).decode()
+
+
+# Callers only enqueue the record; ECS formatting and the console write
+# happen on the listener thread
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(OrjsonEcsFormatter(exclude_fields=EXCLUDED_FIELDS))
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_handler = EcsQueueHandler(_log_queue)
+_listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+_listener_running = False
+
+
+def _queue_handler_factory() -> EcsQueueHandler:
+    # dictConfig runs once per logger name; every configured logger shares one handler
+    return _queue_handler
+
+
+def start_listener() -> None:
+    """Start the console writer thread for this process."""
+    global _listener_running
+    _listener.start()
+    _listener_running = True
+
+
+def stop_listener() -> None:
+    """Drain queued records and write later ones inline; safe to call more than once."""
+    global _listener_running
+    if _listener_running:
+        _listener_running = False
+        _listener.stop()
+
+
+def _restart_listener_in_child() -> None:
+    """
+    A forked child (e.g. a Celery prefork worker) inherits the queue but not
+    the listener thread, so give it a fresh queue and its own listener.
+    """
+    global _log_queue, _listener
+    _log_queue = queue.SimpleQueue()
+    _queue_handler.queue = _log_queue
+    _listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+    start_listener()
+
+
+start_listener()
+atexit.register(stop_listener)
+os.register_at_fork(after_in_child=_restart_listener_in_child)
 
 
 # =========================
 # Logging Configuration
 # =========================
+_configured_loggers: set[str] = set()
+_BASE_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {
+            "()": _queue_handler_factory,
+            "level": CONSOLE_LOG_LEVEL,
+        }
+    },
+    "root": {
+        "level": LOGGER_LEVEL,
+        "handlers": ["console"],
+    },
+}
+
+
 def logging_config(logger_name: str) -> None:
     """
-    Configure a logger with ECS console handler.
+    Configure a logger that hands records to the background ECS console writer.
+    Repeat calls for an already configured name are no-ops.
     """
-    logging.config.dictConfig(
-        {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "ecs": {
-                    "()": "ecs_logging.StdlibFormatter",
-                    "exclude_fields": EXCLUDED_FIELDS,
-                },
-            },
-            "handlers": {
-                "console": {
-                    "level": "INFO",
-                    "class": "logging.StreamHandler",
-                    "formatter": "ecs",
-                }
-            },
-            "loggers": {
-                f"{logger_name}": {
-                    "level": LOG_LEVEL,
-                    "handlers": ["console"],
-                    "propagate": False,
-                },
-            },
-            "root": {
-                "level": LOG_LEVEL,
-                "handlers": ["console"],
-            },
-        }
-    )
+    if logger_name in _configured_loggers:
+        return
+    _configured_loggers.add(logger_name)
+    # dictConfig pops keys out of the handler entries, so it gets its own copy
+    config = copy.deepcopy(_BASE_CONFIG)
+    config["loggers"] = {
+        logger_name: {
+            "level": LOGGER_LEVEL,
+            "handlers": ["console"],
+            "propagate": False,
+        },
+    }
+    logging.config.dictConfig(config)
 
 
 # =========================
 # Custom Logger Adapter
 # =========================
+# Exact types that normalize_extra passes through untouched
+_SAFE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@functools.lru_cache(maxsize=512)
+def _pick_normalizer(value_type: type) -> Callable[[Any], Any]:
+    """Resolve the normalize_extra conversion for a type once, then reuse it."""
+    # --- Pydantic (v2/v1) ---
+    if hasattr(value_type, "model_dump"):  # Pydantic v2
+        return operator.methodcaller("model_dump")
+    if hasattr(value_type, "dict"):  # Pydantic v1
+        return operator.methodcaller("dict")
+
+    # --- Dataclass ---
+    if dataclasses.is_dataclass(value_type):
+        return dataclasses.asdict
+
+    # --- Enum ---
+    if issubclass(value_type, Enum):
+        return str
+
+    # --- Common JSON-friendly types ---
+    if issubclass(value_type, (dict, list, tuple, str, int, float, bool, type(None))):
+        return _identity
+
+    # --- Fallback: try string conversion ---
+    return str
+
+
 class ValidatingLoggerAdapter(logging.LoggerAdapter):
     """
     Enhanced logger adapter:
@@ -83,50 +246,32 @@ class ValidatingLoggerAdapter(logging.LoggerAdapter):
         if "service" in extra:
             service = extra["service"]
             if not isinstance(service, ServiceLog):
-                if service in ServiceLog._value2member_map_:
+                try:
                     service = ServiceLog(service)
-                else:
-                    raise ValueError(f"Invalid service log value: {service}")
-            extra["service"] = str(service)
+                except ValueError:
+                    raise ValueError(f"Invalid service log value: {service}") from None
+            extra["service"] = service.value
 
         if "log_type" in extra:
             log_type = extra["log_type"]
             if not isinstance(log_type, LogType):
-                if log_type in LogType._value2member_map_:
+                try:
                     log_type = LogType(log_type)
-                else:
-                    raise ValueError(f"Invalid log type value: {log_type}")
-            extra["log_type"] = str(log_type)
+                except ValueError:
+                    raise ValueError(f"Invalid log type value: {log_type}") from None
+            extra["log_type"] = log_type.value
 
         return extra
 
     def normalize_extra(self, extra: dict) -> dict:
         """Convert complex objects in extra to safe, serializable forms."""
+        if all(type(value) in _SAFE_TYPES for value in extra.values()):
+            return extra
+
         normalized = {}
         for key, value in extra.items():
             try:
-                # --- Pydantic (v2/v1) ---
-                if hasattr(value, "model_dump"):  # Pydantic v2
-                    normalized[key] = value.model_dump()
-                elif hasattr(value, "dict"):  # Pydantic v1
-                    normalized[key] = value.dict()
-
-                # --- Dataclass ---
-                elif dataclasses.is_dataclass(value):
-                    normalized[key] = dataclasses.asdict(value)
-
-                # --- Enum ---
-                elif isinstance(value, Enum):
-                    normalized[key] = str(value)
-
-                # --- Common JSON-friendly types ---
-                elif isinstance(value, (dict, list, tuple, str, int, float, bool, type(None))):
-                    normalized[key] = value
-
-                # --- Fallback: try string conversion ---
-                else:
-                    normalized[key] = str(value)
-
+                normalized[key] = _pick_normalizer(type(value))(value)
             except Exception:
                 normalized[key] = f"<Unserializable: {type(value).__name__}>"
         return normalized
@@ -149,6 +294,22 @@ class ValidatingLoggerAdapter(logging.LoggerAdapter):
         kwargs["extra"] = extra
         return msg, kwargs
 
+    def log_fast(self, level: int, msg: str, **fields: Any) -> None:
+        """
+        Log without the caller lookup done by Logger._log, for hot loops.
+
+        Fields are validated and normalized like `extra`; an invalid service or
+        log_type raises ValueError, and a field that would overwrite a LogRecord
+        attribute raises KeyError. The record carries no source file or line number.
+        """
+        base_logger = self.logger
+        if not base_logger.isEnabledFor(level):
+            return
+        extra = self.normalize_extra(self.validate_log_fields(fields))
+        extra.setdefault("environment", ENV)
+        record = base_logger.makeRecord(base_logger.name, level, "", 0, msg, (), None, extra=extra)
+        base_logger.handle(record)
+
 
 # =========================
 # Helper function
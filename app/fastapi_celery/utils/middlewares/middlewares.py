@@ -1,17 +1,17 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from typing import Callable, Awaitable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import re
 import uuid
 import logging
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware to assign a unique UUID as a request ID for each incoming HTTP request.
 
     The request ID is added to the response headers as `X-Request-ID` to facilitate
     tracing and correlation of logs and requests across distributed systems.
+    Implemented as plain ASGI so requests skip BaseHTTPMiddleware's extra task
+    and memory streams.
 
     Usage:
         Add this middleware to your FastAPI or Starlette application to enable
@@ -21,14 +21,26 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         app.add_middleware(RequestIDMiddleware)
     """
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
+        # Read back through request.state.request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+        header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Copy: the list may be the Response object's own raw_headers
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
 
 
 class HealthCheckFilter(logging.Filter):
@@ -37,41 +49,36 @@ class HealthCheckFilter(logging.Filter):
     def __init__(self, exclude_paths: list):
         super().__init__()
         self.exclude_paths = exclude_paths
+        # One compiled alternation scans the message once for all paths;
+        # "(?!)" never matches, so an empty list filters nothing
+        pattern = "|".join(re.escape(path) for path in exclude_paths) or "(?!)"
+        self._search = re.compile(pattern).search
     
     def filter(self, record: logging.LogRecord) -> bool:
         """Return False to filter out (not log) the record."""
-        message = record.getMessage()
+        # uvicorn.access logs '%s - "%s %s HTTP/%s" %d' with the request path
+        # as the third arg, so match it without formatting the whole line
+        args = record.args
+        if isinstance(args, tuple) and len(args) == 5 and isinstance(args[2], str):
+            return self._search(args[2]) is None
         # Check if any excluded path is in the log message
-        return not any(path in message for path in self.exclude_paths)
+        return self._search(record.getMessage()) is None
 
 
-class AccessLogFilterMiddleware(BaseHTTPMiddleware):
+def install_access_log_filter(exclude_paths: list) -> None:
     """
-    Middleware to filter out access logs for specific endpoints (e.g., health check).
+    Filter out access logs for specific endpoints (e.g., health check).
 
     This prevents excessive logging for endpoints that are called frequently by
     monitoring systems or load balancers, reducing log clutter on production systems.
+    The filter is attached to the uvicorn.access logger once, so requests do not
+    pass through an extra middleware layer.
 
     Usage:
-        Add this middleware to your FastAPI application:
-        app.add_middleware(AccessLogFilterMiddleware, exclude_paths=["/fastapi/api_health"])
+        install_access_log_filter(exclude_paths=["/fastapi/api_health"])
 
     Args:
         exclude_paths (list): List of paths to exclude from access logging.
     """
-
-    def __init__(self, app, exclude_paths: list = None):
-        super().__init__(app)
-        self.exclude_paths = exclude_paths or []
-        
-        # Add filter to uvicorn.access logger
-        if self.exclude_paths:
-            uvicorn_logger = logging.getLogger("uvicorn.access")
-            health_filter = HealthCheckFilter(self.exclude_paths)
-            uvicorn_logger.addFilter(health_filter)
-
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        # Just pass through - filtering is done by logging.Filter
-        return await call_next(request)
+    if exclude_paths:
+        logging.getLogger("uvicorn.access").addFilter(HealthCheckFilter(exclude_paths))
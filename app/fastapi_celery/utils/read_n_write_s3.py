@@ -1,5 +1,8 @@
 import io
 import json
+import orjson
+from boto3.exceptions import S3TransferFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import BotoCoreError, ClientError
 from models.class_models import StatusEnum
 from pydantic import BaseModel
@@ -13,15 +16,55 @@ logger = log_helpers.get_logger("Read and Write to S3")
 
 _s3_connectors = {}
 
+# CopyObject is a single request capped at 5 GB; above that S3 rejects it
+# and the copy has to go through parallel UploadPartCopy parts instead
+_COPY_OBJECT_MAX_SIZE = 5 * 1024 * 1024 * 1024
+_MULTIPART_COPY_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16,
+)
+# Uploads above 16 MB are split into 16 MB parts sent on 8 threads
+_UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+)
+# Dates stay on the str() fallback so the stored format matches json.dumps(default=str)
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+def _dump_json_bytes(payload) -> bytes:
+    """Serialize payload to UTF-8 JSON, falling back to json for values orjson rejects."""
+    try:
+        return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS)
+    except TypeError:
+        # e.g. integers wider than 64 bits
+        return json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _load_json_bytes(raw: bytes):
+    """Parse UTF-8 JSON, falling back to json for objects written with NaN/Infinity."""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw.decode("utf-8"))
+
 
 def put_object(client, bucket_name: str, object_name: str, uploading_data) -> dict:
     """Upload data (buffer or file path) to S3."""
     try:
         if isinstance(uploading_data, (io.BytesIO, io.StringIO)):
             uploading_data.seek(0)
-            client.upload_fileobj(uploading_data, Bucket=bucket_name, Key=object_name)
+            client.upload_fileobj(
+                uploading_data, Bucket=bucket_name, Key=object_name, Config=_UPLOAD_CONFIG
+            )
         elif isinstance(uploading_data, str):
-            client.upload_file(Filename=uploading_data, Bucket=bucket_name, Key=object_name)
+            client.upload_file(
+                Filename=uploading_data, Bucket=bucket_name, Key=object_name, Config=_UPLOAD_CONFIG
+            )
         else:
             return {
                 "status": StatusEnum.FAILED,
@@ -43,6 +86,21 @@ def get_object(client, bucket_name: str, object_name: str) -> io.BytesIO | None:
         return None
 
 
+def _copy_exceeds_size_limit(client, error: ClientError, copy_source: dict) -> bool:
+    """Tell whether a failed CopyObject was rejected for the 5 GB limit."""
+    err = error.response.get("Error", {})
+    code = err.get("Code")
+    if code == "EntityTooLarge":
+        return True
+    if code != "InvalidRequest":
+        return False
+    # InvalidRequest also covers unrelated failures (e.g. copying an object onto itself)
+    if "maximum allowable size" in err.get("Message", ""):
+        return True
+    head = client.head_object(Bucket=copy_source["Bucket"], Key=copy_source["Key"])
+    return head.get("ContentLength", 0) > _COPY_OBJECT_MAX_SIZE
+
+
 def copy_object_between_buckets(
     source_bucket: str, source_key: str, dest_bucket: str, dest_key: str
 ) -> dict:
@@ -51,17 +109,19 @@ def copy_object_between_buckets(
         if source_bucket not in _s3_connectors:
             _s3_connectors[source_bucket] = aws_connection.S3Connector(bucket_name=source_bucket)
         client = _s3_connectors[source_bucket].client
-        client.copy_object(
-            CopySource={"Bucket": source_bucket, "Key": source_key},
-            Bucket=dest_bucket,
-            Key=dest_key,
-        )
+        copy_source = {"Bucket": source_bucket, "Key": source_key}
+        try:
+            client.copy_object(CopySource=copy_source, Bucket=dest_bucket, Key=dest_key)
+        except ClientError as e:
+            if not _copy_exceeds_size_limit(client, e, copy_source):
+                raise
+            client.copy(copy_source, dest_bucket, dest_key, Config=_MULTIPART_COPY_CONFIG)
         return {
             "status": StatusEnum.SUCCESS,
             "source": {"bucket": source_bucket, "key": source_key},
             "destination": {"bucket": dest_bucket, "key": dest_key},
         }
-    except (ClientError, BotoCoreError) as e:
+    except (ClientError, BotoCoreError, S3TransferFailedError) as e:
         return {
             "status": StatusEnum.FAILED,
             "error": str(e),
@@ -128,8 +188,7 @@ def write_json_to_s3(
         else:
             payload = json_data
 
-        buffer = io.BytesIO(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8"))
-        buffer.seek(0)
+        buffer = io.BytesIO(_dump_json_bytes(payload))
 
         upload_result = put_object(client, bucket, s3_key_prefix, buffer)
         if upload_result.get("status") == StatusEnum.FAILED:
@@ -171,8 +230,7 @@ def read_json_from_s3(bucket_name: str, object_name: str) -> dict | None:
         if not buffer:
             return None
         # Parse JSON
-        content = buffer.read().decode("utf-8")
-        data = json.loads(content)
+        data = _load_json_bytes(buffer.read())
         if not isinstance(data, dict):
             logger.warning(f"Unexpected JSON type: {type(data)} in {object_name}")
             return None
@@ -199,6 +257,23 @@ def list_objects_with_prefix(bucket_name: str, prefix: str) -> list:
         return []
 
 
+def list_common_prefixes(bucket_name: str, prefix: str, delimiter: str = "/") -> list:
+    """List the sub-folders directly under a prefix, without listing their objects."""
+    try:
+        if bucket_name not in _s3_connectors:
+            _s3_connectors[bucket_name] = aws_connection.S3Connector(bucket_name=bucket_name)
+        client = _s3_connectors[bucket_name].client
+        prefixes = []
+        paginator = client.get_paginator("list_objects_v2")
+        page_iterator = paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter=delimiter)
+        for page in page_iterator:
+            for common_prefix in page.get("CommonPrefixes", []):
+                prefixes.append(common_prefix["Prefix"])
+        return prefixes
+    except Exception:
+        return []
+
+
 def select_latest_rerun(keys: list[str], base_filename: str) -> str | None:
     """
     Select the latest rerun JSON file from an S3 key list.
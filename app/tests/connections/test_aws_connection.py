@@ -2,8 +2,15 @@ import json
 import pytest
 from unittest.mock import patch, MagicMock
 from botocore.exceptions import ClientError
+from fastapi_celery.connections import aws_connection
 from fastapi_celery.connections.aws_connection import S3Connector, AWSSecretsManager
 
+
+@pytest.fixture(autouse=True)
+def reset_s3_clients(monkeypatch):
+    """Give each test a fresh client cache so it sees its own boto3 mock."""
+    monkeypatch.setattr(aws_connection, "_s3_clients", {})
+
 # === S3Connector Tests ===
 
 @patch("boto3.client")
@@ -39,6 +46,17 @@ def test_s3connector_create_bucket_raises_client_error(mock_boto_client):
     with pytest.raises(ClientError):
         S3Connector(bucket_name="fail-bucket")
 
+@patch("boto3.client")
+def test_s3connector_shares_client_per_region(mock_boto_client):
+    """Connectors for different buckets in one region reuse a single client."""
+    first = S3Connector(bucket_name="bucket-a", region_name="ap-southeast-1")
+    second = S3Connector(bucket_name="bucket-b", region_name="ap-southeast-1")
+
+    assert first.client is second.client
+    mock_boto_client.assert_called_once_with(
+        "s3", region_name="ap-southeast-1", config=aws_connection._S3_CLIENT_CONFIG
+    )
+
 # === AWSSecretsManager Tests ===
 
 @patch("boto3.client")
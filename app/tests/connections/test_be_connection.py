@@ -1,6 +1,7 @@
 # tests/test_be_connection.py
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
+from fastapi_celery.connections import be_connection
 from fastapi_celery.connections.be_connection import BEConnector
 
 # === Test BEConnector ===
@@ -53,6 +54,24 @@ async def test_put_success():
         mock_response.raise_for_status.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_requests_share_one_client_per_loop():
+    """Calls on the same event loop reuse one pooled client until it is closed."""
+    mock_response = MagicMock()
+    mock_response.json = MagicMock(return_value={"data": {}})
+
+    with patch("httpx.AsyncClient.request", return_value=mock_response):
+        await BEConnector(api_url="https://fakeapi.com").post()
+        client = be_connection._get_client()
+        await BEConnector(api_url="https://fakeapi.com").get()
+        assert be_connection._get_client() is client
+
+    await be_connection.close_client()
+    assert client.is_closed
+    assert be_connection._get_client() is not client
+    await be_connection.close_client()
+
+
 def test_get_field_existing_and_missing():
     """Test BEConnector.get_field returns correct value."""
     connector = BEConnector(api_url="https://fakeapi.com")
@@ -98,14 +98,30 @@ def test_update_step_fields_failure(mock_redis_class):
 @patch("fastapi_celery.connections.redis_connection.redis.Redis")  
 def test_get_all_steps_for_task_success(mock_redis_class):
     mock_redis = mock_redis_class.return_value
-    mock_redis.scan_iter.return_value = [b"celery_task:task123:step_id:step1"]
+    mock_redis.scan_iter.return_value = [
+        b"celery_task:task123:step_id:step1",
+        "celery_task:task123:step_id:step2",
+    ]
+    pipe = mock_redis.pipeline.return_value
+    pipe.execute.return_value = [{"ok": json.dumps(True), "raw": "not-json"}, {}]
 
     redis_conn = RedisConnector()
-    with patch.object(redis_conn, "get_step_processing", return_value={"ok": True}) as mock_get:
-        result = redis_conn.get_all_steps_for_task("task123")
+    result = redis_conn.get_all_steps_for_task("task123")
 
-    assert "step1" in result
-    assert result["step1"] == {"ok": True}
+    assert result == {"step1": {"ok": True, "raw": "not-json"}, "step2": None}
+    assert pipe.hgetall.call_count == 2
+    pipe.execute.assert_called_once()
+
+
+@patch("fastapi_celery.connections.redis_connection.redis.Redis")
+def test_get_all_steps_for_task_pipeline_failure(mock_redis_class):
+    mock_redis = mock_redis_class.return_value
+    mock_redis.scan_iter.return_value = ["celery_task:task123:step_id:step1"]
+    mock_redis.pipeline.return_value.execute.side_effect = RedisError("Connection error")
+
+    result = RedisConnector().get_all_steps_for_task("task123")
+
+    assert result == {"step1": None}
 
 # # -------------------------
 # # store_celery_task
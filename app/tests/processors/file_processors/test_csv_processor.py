@@ -34,14 +34,14 @@ def mock_file_record_buffer():
     }
 
 
-@patch("fastapi_celery.processors.file_processors.csv_processor.chardet.detect", return_value={"encoding": "utf-8"})
+@patch("chardet.detect", return_value={"encoding": "utf-8"})
 def test_load_csv_rows_local(mock_detect, mock_file_record_local):
     processor = CSVProcessor(mock_file_record_local)
     rows = processor.rows
     assert rows == [["col1", "col2"], ["val1", "val2"]]
 
 
-@patch("fastapi_celery.processors.file_processors.csv_processor.chardet.detect", return_value={"encoding": "utf-8"})
+@patch("chardet.detect", return_value={"encoding": "utf-8"})
 def test_load_csv_rows_buffer(mock_detect, mock_file_record_buffer):
     processor = CSVProcessor(mock_file_record_buffer)
     rows = processor.rows
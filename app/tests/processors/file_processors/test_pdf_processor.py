@@ -1,43 +1,46 @@
 import pytest
-from pathlib import Path
 import pymupdf as fitz
-import pdfplumber
 from fastapi_celery.processors.file_processors import pdf_processor
 from fastapi_celery.processors.helpers.pdf_helper import PODataParsed, StatusEnum
 
+# ---------- Helper to create dummy PDF ----------
+@pytest.fixture(scope="session")
+def dummy_pdf_path(tmp_path_factory):
+    # Built once per session; the tests only read it
+    dummy_pdf_path = tmp_path_factory.mktemp("pdf") / "dummy.pdf"
+    doc = fitz.open()  # tạo PDF trống
+    page = doc.new_page()
+    page.insert_text((72, 72), "Dummy PDF content")
+    doc.save(str(dummy_pdf_path))
+    doc.close()
+    yield dummy_pdf_path
+    if dummy_pdf_path.exists():
+        dummy_pdf_path.unlink()
+
 # ---------- Fixtures ----------
 @pytest.fixture
-def dummy_file_record_local():
+def dummy_file_record_local(dummy_pdf_path):
     return {
         "source_type": "local",
-        "file_path": "dummy.pdf",
+        "file_path": str(dummy_pdf_path),
         "document_type": "order",  # sửa PO → order
         "file_size": "100 KB",
     }
 
 @pytest.fixture
-def dummy_file_record_buffer():
+def dummy_file_record_buffer(dummy_pdf_path):
     from io import BytesIO
     return {
         "source_type": "s3",
         "object_buffer": BytesIO(b"Dummy PDF content"),
-        "file_path": "dummy.pdf",
+        "file_path": str(dummy_pdf_path),
         "document_type": "order",
         "file_size": "100 KB",
     }
 
-# ---------- Helper to create dummy PDF ----------
-@pytest.fixture(autouse=True)
-def create_dummy_pdf():
-    dummy_pdf_path = Path("dummy.pdf")
-    doc = fitz.open()  # tạo PDF trống
-    page = doc.new_page()
-    page.insert_text((72, 72), "Dummy PDF content")
-    doc.save(str(dummy_pdf_path))
-    doc.close()
-    yield
-    if dummy_pdf_path.exists():
-        dummy_pdf_path.unlink()
+@pytest.fixture
+def pdf004_processor(dummy_file_record_local):
+    return pdf_processor.Pdf004Template(dummy_file_record_local)
 
 # ---------- Tests that passed remain unchanged ----------
 def test_pdf001_extract_metadata_and_tables_simple():
@@ -94,37 +97,50 @@ def test_pdf001_parse_file_to_json_local(dummy_file_record_local):
     processor = pdf_processor.Pdf001Template(dummy_file_record_local)
     result = processor.parse_file_to_json()
     assert isinstance(result, PODataParsed)
-    assert result.step_status in [StatusEnum.SUCCESS, StatusEnum.FAILED]
-
-def test_pdf004_parse_item_lines_and_build_table(dummy_file_record_local):
-    processor = pdf_processor.Pdf004Template(dummy_file_record_local)
-    # Mock method nếu không tồn tại
-    if not hasattr(processor, "parse_item_lines_and_build_table"):
-        processor.parse_item_lines_and_build_table = lambda lines: [[line] for line in lines]
-    table = processor.parse_item_lines_and_build_table(["Line1", "Line2"])
-    assert table == [["Line1"], ["Line2"]]
+    assert result.step_status == StatusEnum.SUCCESS
+    assert result.items == [{}]
+
+def test_pdf004_parse_item_lines_and_build_table(pdf004_processor):
+    lines = ["產品編號 品名規格 數量", "S1234567 Widget 10 PCS 1,200 12,000 2025/01/01 10"]
+    items = pdf004_processor.parse_item_lines(lines)
+    assert items == [(lines[1], "")]
+    table = pdf004_processor.build_table_from_items(items)
+    assert table == [{
+        "產品編號": "S1234567",
+        "品名規格": "Widget",
+        "數量": "10",
+        "單位": "PCS",
+        "單價": "1200",
+        "金額": "12000",
+        "預進貨日": "2025/01/01",
+        "未轉數量": "10",
+    }]
 
 def test_pdf004_parse_file_to_json_with_pdfplumber(dummy_file_record_local):
     processor = pdf_processor.Pdf004Template(dummy_file_record_local)
     result = processor.parse_file_to_json()
     assert isinstance(result, PODataParsed)
-    assert result.step_status in [StatusEnum.SUCCESS, StatusEnum.FAILED]
+    assert result.step_status == StatusEnum.SUCCESS
+    assert result.items == []
 
-def test_pdf004_parse_item_lines_with_additional_spec(dummy_file_record_local):
-    processor = pdf_processor.Pdf004Template(dummy_file_record_local)
-    if not hasattr(processor, "parse_item_lines_and_build_table"):
-        processor.parse_item_lines_and_build_table = lambda lines: [[line] for line in lines]
-    table = processor.parse_item_lines_and_build_table(["Line1", "Spec: A"])
-    assert table == [["Line1"], ["Spec: A"]]
+def test_pdf004_parse_item_lines_with_additional_spec(pdf004_processor):
+    lines = ["S1234567A Widget 5 BOX 100 500 2025/01/01 0", "12入/盒"]
+    items = pdf004_processor.parse_item_lines(lines)
+    assert items == [(lines[0], "12入/盒")]
+    table = pdf004_processor.extract_tables(lines)
+    assert table[0]["品名規格"] == "Widget 12入/盒"
+    assert len(table) == 1
 
 def test_pdf006_parse_kv_and_notes_and_items(dummy_file_record_local):
     processor = pdf_processor.Pdf006Template(dummy_file_record_local)
     result = processor.parse_file_to_json()
     assert isinstance(result, PODataParsed)
-    assert result.step_status in [StatusEnum.SUCCESS, StatusEnum.FAILED]
+    assert result.step_status == StatusEnum.SUCCESS
+    assert result.items == []
 
 def test_pdf008_parse_file_to_json(dummy_file_record_local):
     processor = pdf_processor.Pdf008Template(dummy_file_record_local)
     result = processor.parse_file_to_json()
     assert isinstance(result, PODataParsed)
-    assert result.step_status in [StatusEnum.SUCCESS, StatusEnum.FAILED]
+    # No item rows in the dummy PDF, so reading the first row's PO number fails
+    assert result.step_status == StatusEnum.FAILED
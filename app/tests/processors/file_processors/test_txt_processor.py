@@ -1,17 +1,19 @@
 import io
-import builtins
 import pytest
-from unittest.mock import mock_open, patch
+from unittest.mock import MagicMock
 
 from fastapi_celery.models.class_models import StatusEnum, DocumentType
 from fastapi_celery.processors.file_processors.txt_processor import TXTProcessor, PO_MAPPING_KEY
 
+SAMPLE_TEXT = "採購單-PO123\n料品代號\t品名\t數量\nA001\tABC\t10"
+SAMPLE_BYTES = SAMPLE_TEXT.encode("utf-8")
+
 
 @pytest.fixture
 def local_file_record(tmp_path):
     """Fixture for local TXT file"""
     file_path = tmp_path / "dummy.txt"
-    file_path.write_text("採購單-PO123\n料品代號\t品名\t數量\nA001\tABC\t10", encoding="utf-8")
+    file_path.write_bytes(SAMPLE_BYTES)
     return {
         "source_type": "local",
         "file_path": str(file_path),
@@ -23,7 +25,7 @@ def local_file_record(tmp_path):
 @pytest.fixture
 def s3_file_record():
     """Fixture for S3-like TXT file"""
-    buffer = io.BytesIO("採購單-PO123\n料品代號\t品名\t數量\nA001\tABC\t10".encode("utf-8"))
+    buffer = io.BytesIO(SAMPLE_BYTES)
     return {
         "source_type": "s3",
         "object_buffer": buffer,
@@ -35,12 +37,8 @@ def s3_file_record():
 
 def test_extract_text_local(local_file_record):
     """Extract text from a local file"""
-    txt_content = "採購單-PO123\n料品代號\t品名\t數量\nA001\tABC\t10"
-    m_open = mock_open(read_data=txt_content)
-
-    with patch.object(builtins, "open", m_open):
-        processor = TXTProcessor(local_file_record)
-        result = processor.extract_text()
+    processor = TXTProcessor(local_file_record)
+    result = processor.extract_text()
 
     assert "PO123" in result
     assert "ABC" in result
@@ -119,11 +117,19 @@ def test_parse_file_no_products(s3_file_record):
     assert "products" not in parsed.items
 
 
-def test_logger_called(monkeypatch, s3_file_record):
+@pytest.fixture
+def mock_txt_logger(monkeypatch):
+    """Replace the txt_processor logger; monkeypatch restores it at teardown"""
+    mock_logger = MagicMock()
+    monkeypatch.setattr(
+        "fastapi_celery.processors.file_processors.txt_processor.logger", mock_logger
+    )
+    return mock_logger
+
+
+def test_logger_called(mock_txt_logger, s3_file_record):
     """Ensure logging messages are triggered"""
-    mock_logger = patch(
-        "fastapi_celery.processors.file_processors.txt_processor.logger"
-    ).start()
+    mock_logger = mock_txt_logger
 
     processor = TXTProcessor(s3_file_record)
     processor.parse_file_to_json()
@@ -132,7 +138,6 @@ def test_logger_called(monkeypatch, s3_file_record):
     mock_logger.info.assert_any_call(
         f"Start processing for file: {s3_file_record.get('file_path')}"
     )
-    patch.stopall()
 
 
 def test_file_with_extra_spaces(s3_file_record):
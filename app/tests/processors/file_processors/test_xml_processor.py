@@ -1,3 +1,4 @@
+import io
 import unittest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
@@ -6,6 +7,11 @@ from fastapi_celery.processors.file_processors.xml_processor import XMLProcessor
 from fastapi_celery.models.class_models import PODataParsed
 
 
+def _fake_open(content):
+    """open() replacement that hands back a plain in-memory text file."""
+    return lambda *args, **kwargs: io.StringIO(content)
+
+
 class TestXMLProcessor(unittest.TestCase):
     def setUp(self):
         self.dummy_path = Path("dummy.xml")
@@ -31,9 +37,7 @@ class TestXMLProcessor(unittest.TestCase):
         }
 
     def test_extract_text_from_s3(self):
-        buffer = MagicMock()
-        buffer.read.return_value = self.xml_content.encode("utf-8")
-        buffer.seek.return_value = None
+        buffer = io.BytesIO(self.xml_content.encode("utf-8"))
 
         file_record = {
             "file_path": str(self.dummy_path),
@@ -48,7 +52,7 @@ class TestXMLProcessor(unittest.TestCase):
         self.assertIn("<Invoice>", text)
 
     def test_extract_text_local_file(self):
-        with patch("builtins.open", unittest.mock.mock_open(read_data=self.xml_content)):
+        with patch("builtins.open", side_effect=_fake_open(self.xml_content)):
             processor = XMLProcessor(file_record=self.file_record)
             text = processor.extract_text()
             self.assertIn("<Invoice>", text)
@@ -93,7 +97,7 @@ class TestXMLProcessor(unittest.TestCase):
         self.assertEqual(po, "")
 
     def test_parse_file_to_json(self):
-        with patch("builtins.open", unittest.mock.mock_open(read_data=self.xml_content)):
+        with patch("builtins.open", side_effect=_fake_open(self.xml_content)):
             with patch(
                 "fastapi_celery.processors.file_processors.xml_processor.PODataParsed"
             ) as MockPODataParsed:
@@ -115,7 +119,7 @@ class TestXMLProcessor(unittest.TestCase):
 
     def test_parse_file_to_json_invalid_xml(self):
         bad_content = "<Invoice><Header></Invoice"  # invalid XML
-        with patch("builtins.open", unittest.mock.mock_open(read_data=bad_content)):
+        with patch("builtins.open", side_effect=_fake_open(bad_content)):
             processor = XMLProcessor(file_record=self.file_record)
             with self.assertRaises(Exception):
                 processor.parse_file_to_json()
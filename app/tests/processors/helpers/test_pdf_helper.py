@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import MagicMock
+from pydantic import ValidationError
 from fastapi_celery.processors.helpers import pdf_helper
 from fastapi_celery.models.class_models import StatusEnum
 
@@ -29,9 +30,23 @@ def test_build_success_response_basic():
     assert result.metadata == metadata
     assert result.file_size  == file_size 
     assert result.step_status == StatusEnum.SUCCESS
+    assert str(result.step_status) == "SUCCESS"
     assert result.messages is None
 
 
+def test_build_success_response_rejects_invalid_output():
+    """Invalid template output raises, so the template falls back to a failed response."""
+    with pytest.raises(ValidationError):
+        pdf_helper.build_success_response(
+            file_path="dummy.pdf",
+            document_type="order",
+            po_number=123,
+            items=[],
+            metadata={"meta": 1},
+            file_size=None,
+        )
+
+
 def test_build_failed_response_default(monkeypatch):
     mock_logger = MagicMock()
     monkeypatch.setattr(pdf_helper, "logger", mock_logger)
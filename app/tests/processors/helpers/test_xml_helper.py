@@ -72,3 +72,34 @@ def test_build_processor_setting_xml_invalid_input_type(mock_logger):
     mock_logger.warning.assert_called_once_with(
         "[build_processor_setting_xml] No processor arguments provided."
     )
+
+
+def test_get_data_output_for_rule_mapping_skips_unnamed_args(mock_logger):
+    response_api = {
+        "processorArgumentDtos": [
+            {"processorArgumentName": "Param1", "value": "Value1"},
+            {"value": "orphan"},
+        ]
+    }
+
+    result = xml_helper.get_data_output_for_rule_mapping(response_api)
+
+    assert result["processorArgs"] == [{"name": "Param1", "value": "Value1"}]
+    assert "<Param1>Value1</Param1>" in result["processorConfigXml"]
+    assert "orphan" not in result["processorConfigXml"]
+
+
+def test_get_data_output_for_rule_mapping_missing_value_renders_empty(mock_logger):
+    response_api = {"processorArgumentDtos": [{"processorArgumentName": "Param1"}]}
+
+    result = xml_helper.get_data_output_for_rule_mapping(response_api)
+
+    assert result["processorArgs"] == [{"name": "Param1", "value": ""}]
+    assert "<Param1></Param1>" in result["processorConfigXml"]
+
+
+def test_get_data_output_for_rule_mapping_no_args_keeps_default(mock_logger):
+    result = xml_helper.get_data_output_for_rule_mapping({"processorArgumentDtos": None})
+
+    assert result["processorArgs"] == []
+    assert result["processorConfigXml"] == "<PROCESSORSETTINGXML></PROCESSORSETTINGXML>"
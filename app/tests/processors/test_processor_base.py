@@ -18,6 +18,36 @@ def fake_tracking_model():
     return FakeTrackingModel()
 
 
+@pytest.fixture(autouse=True)
+def reset_workflow_functions(monkeypatch):
+    """Clear the per-process discovery cache so each test sees its own imports."""
+    monkeypatch.setattr(processor_base.ProcessorBase, "_workflow_functions", None)
+    monkeypatch.setattr(processor_base.ProcessorBase, "_workflow_class", None)
+
+
+def test_discovery_runs_once_per_process(monkeypatch, fake_tracking_model):
+    """Later instances reuse the cached functions instead of re-importing."""
+    imported = []
+
+    def fake_import_module(path):
+        imported.append(path)
+        return types.SimpleNamespace(fake_func=lambda self: "done")
+
+    monkeypatch.setattr(importlib, "import_module", fake_import_module)
+    monkeypatch.setattr("processors.processor_base.WORKFLOW_PROCESSORS", ["extract_metadata"])
+
+    first = processor_base.ProcessorBase(fake_tracking_model)
+    second = processor_base.ProcessorBase(fake_tracking_model)
+
+    assert len(imported) == 1
+    assert type(first) is type(second)
+    assert isinstance(first, processor_base.ProcessorBase)
+    assert second.fake_func() == "done"
+    assert first.fake_func.__self__ is first
+    assert second.fake_func.__self__ is second
+    assert "fake_func" not in vars(first)
+
+
 def test_register_workflow_processors_success(monkeypatch, fake_tracking_model):
     """Ensure all modules in WORKFLOW_PROCESSORS are imported successfully."""
     imported = []
@@ -5,6 +5,9 @@ from fastapi_celery.processors.workflow_processors.parse_file_to_json import par
 
 
 class DummyProcessor:
+    def __init__(self, file_record=None):
+        self.file_record = file_record
+
     def parse_file_to_json(self):
         # Giả lập data trả về có items
         return MagicMock(items=[{"a": 1}, {"a": 2}])
@@ -25,9 +28,7 @@ def test_parse_file_to_json_success():
     with patch(
         "fastapi_celery.processors.workflow_processors.parse_file_to_json.ProcessorRegistry.get_processor_for_file"
     ) as mock_get_proc:
-        mock_enum = MagicMock()
-        mock_enum.create_instance.return_value = DummyProcessor()
-        mock_get_proc.return_value = mock_enum
+        mock_get_proc.return_value = DummyProcessor
 
         result = parse_file_to_json(dummy_self, None, None , response_api)
 
@@ -42,7 +43,7 @@ def test_parse_file_to_json_failed():
     schema_object = DummySchema()
     response_api = [{"templateFileParse": {"code": "TEST_CODE"}}]
 
-    # Giả lập get_processor_for_file() trả về None -> lỗi khi gọi create_instance
+    # Giả lập get_processor_for_file() trả về None -> lỗi khi khởi tạo processor
     with patch(
         "fastapi_celery.processors.workflow_processors.parse_file_to_json.ProcessorRegistry.get_processor_for_file",
         return_value=None,
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch
 from fastapi_celery.processors.workflow_processors.rule_mapping_submit import submit, StepOutput
+from fastapi_celery.models.class_models import StatusEnum
 
 class DummyClass:
     metadata_extract = submit
@@ -34,7 +35,7 @@ class TestMetadataExtract(unittest.TestCase):
         self.assertEqual(type(result), StepOutput)
         self.assertEqual(result.data, {"file": "test.csv"})
         self.assertIn("data_output", result.sub_data)
-        self.assertEqual(result.step_status, result.step_status.SUCCESS)
+        self.assertEqual(result.step_status, StatusEnum.SUCCESS)
         self.assertIsNone(result.step_failure_message)
 
         xml = result.sub_data["data_output"]["processorConfigXml"]
@@ -64,7 +65,7 @@ class TestMetadataExtract(unittest.TestCase):
             "<PROCESSORSETTINGXML></PROCESSORSETTINGXML>"
         )
 
-        self.assertEqual(result.step_status, result.step_status.SUCCESS)
+        self.assertEqual(result.step_status, StatusEnum.SUCCESS)
         self.assertIsNone(result.step_failure_message)
 
     @patch("processors.helpers.xml_helper.build_processor_setting_xml")
@@ -83,7 +84,7 @@ class TestMetadataExtract(unittest.TestCase):
         result = self.obj.metadata_extract(data_input, schema_object, response_api)
 
         self.assertEqual(type(result), StepOutput)
-        self.assertEqual(result.step_status, result.step_status.FAILED)
+        self.assertEqual(result.step_status, StatusEnum.FAILED)
         self.assertIn("broken data", result.step_failure_message[0])
         self.assertIn("data_output", result.sub_data)
 
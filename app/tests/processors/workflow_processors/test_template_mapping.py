@@ -81,3 +81,45 @@ def test_template_data_mapping_missing_headers(sample_po_parsed):
 
     assert result.step_status == StatusEnum.FAILED
     assert "expected headers not found" in result.step_failure_message[0]
+
+
+def test_template_data_mapping_orders_and_fills_null_headers(sample_po_parsed):
+    data = sample_po_parsed.model_copy(
+        update={"items": [{"header1": "1", "header2": "2"}, {"header2": "3"}]}
+    )
+    data_input = StepOutput(data=data)
+
+    response_api = {
+        "templateMappingHeaders": [
+            {"header": "header2", "fromHeader": "Unmapping", "order": 3},
+            {"header": "empty_col", "fromHeader": None, "order": 2},
+            {"header": "renamed_col", "fromHeader": "header1", "order": 1},
+        ]
+    }
+
+    result = template_data_mapping(DummySelf(), data_input, None, response_api)
+
+    assert result.step_status == StatusEnum.SUCCESS
+    assert result.data.items == [
+        {"renamed_col": "1", "empty_col": None, "header2": "2"},
+        {"renamed_col": None, "empty_col": None, "header2": "3"},
+    ]
+    assert list(result.data.items[0]) == ["renamed_col", "empty_col", "header2"]
+    assert result.sub_data["data_output"]["mappedHeaders"] == 2
+
+
+@pytest.mark.parametrize("headers, expected_status", [
+    ([{"header": "other", "fromHeader": "Unmapping", "order": 1}], StatusEnum.SUCCESS),
+    ([{"header": "renamed_col", "fromHeader": "not_exist_col", "order": 1}], StatusEnum.FAILED),
+])
+def test_template_data_mapping_no_output_columns_gives_no_items(sample_po_parsed, headers, expected_status):
+    """No header maps to an input column: items is empty, not one {} per row."""
+    data = sample_po_parsed.model_copy(
+        update={"items": [{"header1": "1", "header2": "2"}, {"header1": "3"}]}
+    )
+    data_input = StepOutput(data=data)
+
+    result = template_data_mapping(DummySelf(), data_input, None, {"templateMappingHeaders": headers})
+
+    assert result.step_status == expected_status
+    assert result.data.items == []
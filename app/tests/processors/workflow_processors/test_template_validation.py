@@ -1,3 +1,4 @@
+import json
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -52,6 +53,24 @@ def test_data_validation_success(sample_po_parsed, mock_tracking_model):
     assert data_output["validRecords"] == 2
 
 
+def test_data_validation_parses_metadata_once_per_column(sample_po_parsed, mock_tracking_model):
+    schema = [
+        {"order": 1, "dataType": "Number", "metadata": '{"required": true}'},
+        {"order": 2, "dataType": "String", "metadata": '{"regex": "^[A-Z]{3}$"}'},
+    ]
+    validator = TemplateValidation(sample_po_parsed, mock_tracking_model)
+
+    with patch(
+        "fastapi_celery.processors.workflow_processors.template_validation.json.loads",
+        wraps=json.loads,
+    ) as mock_loads:
+        validated_data, _ = validator.data_validation(schema)
+
+    assert validated_data.step_status == StatusEnum.SUCCESS
+    # One parse per column, regardless of the number of rows
+    assert mock_loads.call_count == len(schema)
+
+
 def test_data_validation_required_missing(sample_po_parsed, mock_tracking_model):
     schema = [{"order": 1, "dataType": "Number", "metadata": '{"required": true, "allowEmpty": false}'}]
     parsed = sample_po_parsed.model_copy(update={
@@ -107,6 +126,58 @@ def test_data_validation_invalid_date(sample_po_parsed, mock_tracking_model):
     assert any("is not a valid date" in msg for msg in validated_data.messages)
 
 
+@pytest.mark.parametrize("good_dates", [
+    ["2024-01-01", "02/03/2024"],
+    ["2024-01-01T10:00:00+07:00", "2024-01-01T10:00:00+01:00"],
+])
+def test_data_validation_reports_invalid_date_rows(sample_po_parsed, mock_tracking_model, good_dates):
+    schema = [{"order": 3, "dataType": "Date"}]
+    parsed = sample_po_parsed.model_copy(update={
+        "items": [
+            {"col_1": "1", "col_2": "ABC", "col_3": good_dates[0]},
+            {"col_1": "2", "col_2": "ABC", "col_3": "invalid"},
+            {"col_1": "3", "col_2": "ABC", "col_3": good_dates[1]},
+            {"col_1": "4", "col_2": "ABC", "col_3": None},
+        ]
+    })
+    validator = TemplateValidation(parsed, mock_tracking_model)
+    validated_data, data_output = validator.data_validation(schema)
+
+    assert validated_data.messages == ["Row 3: 'col_3'='invalid' is not a valid date"]
+    assert data_output["errorRecords"] == 1
+
+
+def test_data_validation_accepts_nat_like_date_strings(sample_po_parsed, mock_tracking_model):
+    """Strings pandas reads as NaT ("nan", "NaT", "") pass, as with the per-cell parse."""
+    schema = [{"order": 3, "dataType": "Date"}]
+    parsed = sample_po_parsed.model_copy(update={
+        "items": [
+            {"col_1": "1", "col_2": "ABC", "col_3": "nan"},
+            {"col_1": "2", "col_2": "ABC", "col_3": "NaT"},
+            {"col_1": "3", "col_2": "ABC", "col_3": "invalid"},
+        ]
+    })
+    validator = TemplateValidation(parsed, mock_tracking_model)
+    validated_data, data_output = validator.data_validation(schema)
+
+    assert validated_data.messages == ["Row 4: 'col_3'='invalid' is not a valid date"]
+    assert data_output["errorRecords"] == 1
+
+
+def test_data_validation_skips_out_of_range_orders(sample_po_parsed, mock_tracking_model):
+    schema = [
+        {"order": 0, "dataType": "Number"},
+        {"order": -1, "dataType": "Number"},
+        {"order": 4, "dataType": "Number"},
+        {"order": "1", "dataType": "Number"},
+    ]
+    validator = TemplateValidation(sample_po_parsed, mock_tracking_model)
+    validated_data, data_output = validator.data_validation(schema)
+
+    assert validated_data.step_status == StatusEnum.SUCCESS
+    assert data_output["errorRecords"] == 0
+
+
 @patch("fastapi_celery.models.class_models.PODataParsed.model_dump_json", lambda self, **kwargs: "{}")
 def test_template_format_validation_success(sample_po_parsed, mock_tracking_model):
     class DummySelf:
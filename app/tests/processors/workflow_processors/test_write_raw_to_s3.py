@@ -1,3 +1,5 @@
+import threading
+import time
 import pytest
 from unittest.mock import MagicMock, patch
 from fastapi_celery.processors.workflow_processors import write_raw_to_s3
@@ -29,7 +31,7 @@ def test_write_raw_to_s3_success_first_version(fake_processor):
         patch.object(write_raw_to_s3, "logger") as mock_logger,
     ):
         mock_s3.copy_object_between_buckets.return_value = {"result": "ok"}
-        mock_s3.list_objects_with_prefix.return_value = []
+        mock_s3.list_common_prefixes.return_value = []
 
         result = write_raw_to_s3.write_raw_to_s3(fake_processor)
 
@@ -46,9 +48,10 @@ def test_write_raw_to_s3_success_first_version(fake_processor):
 
 def test_write_raw_to_s3_success_next_version(fake_processor):
     """Should increment version number when previous exist."""
-    existing_keys = [
-        "versioning/test/001/test.csv",
-        "versioning/test/002/test.csv",
+    existing_folders = [
+        "versioning/test/001/",
+        "versioning/test/002/",
+        "versioning/test/tmp/",
     ]
 
     with (
@@ -56,7 +59,7 @@ def test_write_raw_to_s3_success_next_version(fake_processor):
         patch.object(write_raw_to_s3, "logger") as mock_logger,
     ):
         mock_s3.copy_object_between_buckets.return_value = {"result": "ok"}
-        mock_s3.list_objects_with_prefix.return_value = existing_keys
+        mock_s3.list_common_prefixes.return_value = existing_folders
 
         result = write_raw_to_s3.write_raw_to_s3(fake_processor)
 
@@ -82,3 +85,55 @@ def test_write_raw_to_s3_exception(fake_processor):
 
         assert "S3 copy failed" in str(excinfo.value)
         mock_logger.error.assert_called_once()
+
+
+def _copy_side_effect(target_done, target_error=None):
+    """Version copy fails only once the target copy is running, so it cannot be cancelled."""
+    target_started, version_failed = threading.Event(), threading.Event()
+
+    def copy(**kwargs):
+        if kwargs["dest_key"].startswith("master_data/"):
+            target_started.set()
+            version_failed.wait(timeout=5)
+            time.sleep(0.05)
+            target_done.set()
+            if target_error:
+                raise target_error
+            return {"result": "ok"}
+        target_started.wait(timeout=5)
+        version_failed.set()
+        raise Exception("version copy failed")
+    return copy
+
+
+def test_write_raw_to_s3_waits_for_target_copy_when_version_copy_fails(fake_processor):
+    """A failed version copy still waits for the in-flight target copy before raising."""
+    target_done = threading.Event()
+    with (
+        patch.object(write_raw_to_s3, "read_n_write_s3") as mock_s3,
+        patch.object(write_raw_to_s3, "logger"),
+    ):
+        mock_s3.list_common_prefixes.return_value = []
+        mock_s3.copy_object_between_buckets.side_effect = _copy_side_effect(target_done)
+
+        with pytest.raises(Exception, match="version copy failed"):
+            write_raw_to_s3.write_raw_to_s3(fake_processor)
+
+        assert target_done.is_set()
+
+
+def test_write_raw_to_s3_surfaces_target_copy_error_on_failure(fake_processor):
+    """If both copies fail, the target copy's error is raised with the version error as context."""
+    with (
+        patch.object(write_raw_to_s3, "read_n_write_s3") as mock_s3,
+        patch.object(write_raw_to_s3, "logger"),
+    ):
+        mock_s3.list_common_prefixes.return_value = []
+        mock_s3.copy_object_between_buckets.side_effect = _copy_side_effect(
+            threading.Event(), RuntimeError("target copy failed")
+        )
+
+        with pytest.raises(RuntimeError, match="target copy failed") as excinfo:
+            write_raw_to_s3.write_raw_to_s3(fake_processor)
+
+        assert "version copy failed" in str(excinfo.value.__context__)
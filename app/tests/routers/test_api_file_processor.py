@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
@@ -52,6 +53,23 @@ def test_process_file_failure(mock_connection, mock_apply_async, mock_apply_asyn
     assert "Task submission failed" in res_json.get("detail", "") or "Internal Server Error" in res_json.get("detail", "")
 
 
+@patch("celery.app.task.Task.apply_async")
+def test_process_file_cancel_uses_new_task_id(mock_apply_async_task):
+    payload = {
+        "file_path": "/some/path/to/file.csv",
+        "project": "test_project",
+        "source": "SFTP",
+        "celery_id": "existing-id",
+        "is_cancel": "True",
+    }
+    response = client.post("/file/process", json=payload)
+
+    assert response.status_code == 200
+    assert response.json()["celery_id"] == "existing-id"
+    task_id = mock_apply_async_task.call_args.kwargs["task_id"]
+    assert task_id and task_id != "existing-id"
+
+
 # ------------------ /tasks/stop Tests ------------------
 
 @patch("fastapi_celery.routers.api_file_processor.DISABLE_STOP_TASK_ENDPOINT", False)
@@ -105,6 +123,62 @@ def test_stop_task_success(mock_get_celery_task, mock_get_all_steps_for_task, mo
     mock_revoke.assert_called_once_with("task_123", terminate=True, signal="SIGKILL")
 
 
+@patch("fastapi_celery.routers.api_file_processor.DISABLE_STOP_TASK_ENDPOINT", False)
+@patch("fastapi_celery.routers.api_file_processor.celery_app.control.revoke")
+@patch("fastapi_celery.routers.api_file_processor.read_n_write_s3.write_json_to_s3", return_value={"status": "Success", "error": None})
+@patch("fastapi_celery.routers.api_file_processor.get_s3_key_prefix", return_value="mock/prefix.json")
+@patch("fastapi_celery.routers.api_file_processor.BEConnector")
+@patch("fastapi_celery.routers.api_file_processor.RedisConnector.get_all_steps_for_task")
+@patch("fastapi_celery.routers.api_file_processor.RedisConnector.get_celery_task")
+def test_stop_task_finishes_steps_concurrently(mock_get_celery_task, mock_get_all_steps_for_task, mock_BEConnector, mock_get_prefix, mock_write_json, mock_revoke):
+    mock_get_celery_task.return_value = {
+        "status": StatusEnum.PROCESSING.name,
+        "file_record": {
+            "target_bucket_name": "mock-bucket",
+            "file_path": "/tmp/order.csv",
+            "document_type": "order",
+            "file_size": "111",
+        },
+        "tracking_model": {"request_id": "req_001"},
+        "context_data": {
+            "request_id": "req_001",
+            "step_detail": [{}, {}, {}],
+            "workflow_detail": {"metadata_api": {"session_finish_api": {}}},
+        },
+        "start_session_model": {"id": "session_1"},
+    }
+    mock_get_all_steps_for_task.return_value = {
+        f"step_{order}": {
+            "status": "PROCESSING",
+            "step": {"workflowStepId": str(order), "stepName": f"Step {order}", "stepOrder": order},
+            "start_step_model": {"workflowHistoryId": f"hist_{order}"},
+        }
+        for order in (1, 2)
+    }
+
+    in_flight = {"now": 0, "max": 0}
+
+    def _connector(url, body_data):
+        async def _post():
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0)
+            in_flight["now"] -= 1
+            return {"history": body_data.get("workflowHistoryId", "session")}
+        connector = MagicMock()
+        connector.post = _post
+        return connector
+    mock_BEConnector.side_effect = _connector
+
+    response = client.post("/tasks/stop", json={"task_id": "task_789"})
+
+    assert response.status_code == 200
+    assert in_flight["max"] == 2
+    step_detail = mock_write_json.call_args.kwargs["json_data"].data.step_detail
+    assert step_detail[1]["metadata_api"]["Step_finish_api"]["response"] == {"history": "hist_1"}
+    assert step_detail[2]["metadata_api"]["Step_finish_api"]["response"] == {"history": "hist_2"}
+
+
 @patch("fastapi_celery.routers.api_file_processor.DISABLE_STOP_TASK_ENDPOINT", False)
 @patch("fastapi_celery.routers.api_file_processor.celery_app.control.revoke")
 @patch("fastapi_celery.routers.api_file_processor.BEConnector") 
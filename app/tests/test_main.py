@@ -1,3 +1,5 @@
+import logging
+from fastapi import Request
 from fastapi.testclient import TestClient
 from fastapi_celery.main import app
 
@@ -34,3 +36,38 @@ def test_request_id_middleware_generates_id():
     response = client.get("/fastapi/api_health")
     assert "X-Request-ID" in response.headers
     assert len(response.headers["X-Request-ID"]) > 0
+
+
+def test_request_id_middleware_sets_request_state():
+    """The header value matches request.state.request_id seen by handlers."""
+
+    @app.get("/echo_request_id")
+    async def echo_request_id(request: Request):
+        return {"request_id": request.state.request_id}
+
+    response = client.get("/fastapi/echo_request_id")
+    assert response.json()["request_id"] == response.headers["X-Request-ID"]
+
+
+def test_access_log_filter_installed_on_uvicorn_logger():
+    """Health-check access logs are filtered without an extra middleware."""
+    access_logger = logging.getLogger("uvicorn.access")
+    fmt = '%s - "%s %s HTTP/%s" %d'
+    health = access_logger.makeRecord(
+        "uvicorn.access", logging.INFO, __file__, 1, fmt, ("1.2.3.4", "GET", "/fastapi/api_health", "1.1", 200), None
+    )
+    other = access_logger.makeRecord(
+        "uvicorn.access", logging.INFO, __file__, 1, fmt, ("1.2.3.4", "POST", "/fastapi/file/process", "1.1", 200), None
+    )
+    assert not access_logger.filter(health)
+    assert access_logger.filter(other)
+    assert all(m.cls.__name__ != "AccessLogFilterMiddleware" for m in app.user_middleware)
+
+
+def test_access_log_filter_falls_back_to_formatted_message():
+    """Records not in uvicorn's access-log shape are matched on their message."""
+    access_logger = logging.getLogger("uvicorn.access")
+    record = access_logger.makeRecord(
+        "uvicorn.access", logging.INFO, __file__, 1, "probe %s", ("/fastapi/api_health",), None
+    )
+    assert not access_logger.filter(record)
@@ -103,6 +103,13 @@ def test_get_s3_key_prefix_order(tracking_model, file_record_order, workflow_ste
         prefix = bucket_helper.get_s3_key_prefix(file_record_order, tracking_model, workflow_step)
         assert "process_data/order_folder/customerA/" in prefix
 
+def test_get_s3_key_prefix_uses_proceed_at_date(tracking_model, file_record_order, workflow_step):
+    file_record_order["proceed_at"] = "2024-07-08 23:59:59"
+    with patch("utils.bucket_helper.get_step_name", return_value="STEP_X"), \
+         patch("utils.bucket_helper.PROCESS_DEFINITIONS", MOCK_PROCESS_DEFINITIONS):
+        prefix = bucket_helper.get_s3_key_prefix(file_record_order, tracking_model, workflow_step)
+        assert prefix.startswith("process_data/order_folder/customerA/20240708/REQ-1/")
+
 def test_get_s3_key_prefix_no_step_name(tracking_model, file_record_order, workflow_step):
     with patch("utils.bucket_helper.get_step_name", return_value=None):
         prefix = bucket_helper.get_s3_key_prefix(file_record_order, tracking_model, workflow_step)
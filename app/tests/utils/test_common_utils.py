@@ -64,6 +64,20 @@ def test_get_csv_buffer_file_with_pydantic_model(monkeypatch):
     assert "10,20" in csv_str
 
 
+def test_get_csv_buffer_file_text_rows_match_pandas():
+    """ Case: uniform text rows skip pandas but produce the same CSV as to_csv."""
+    items = [
+        {"name": "a,b", "note": 'say "hi"', "empty": None},
+        {"name": "line\nbreak", "note": "", "empty": None},
+    ]
+    expected = pd.DataFrame(items).to_csv(index=False).encode("utf-8")
+
+    with patch.object(common_utils.pd, "DataFrame", side_effect=AssertionError("pandas used")):
+        buf = common_utils.get_csv_buffer_file(DummyInput(data=MagicMock(items=items)))
+
+    assert buf.getvalue() == expected
+
+
 def test_get_csv_buffer_file_empty_payload(monkeypatch):
     """ Case: items is empty list -> raises ValueError."""
     data_input = DummyInput(data=MagicMock(items=[]))
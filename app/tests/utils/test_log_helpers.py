@@ -1,6 +1,10 @@
+import queue
+import sys
+import json
 import logging
 import dataclasses
 import pytest
+import ecs_logging
 from pydantic import BaseModel
 
 from fastapi_celery.models.tracking_models import LogType, ServiceLog
@@ -24,6 +28,7 @@ class DummyModel(BaseModel):
 def test_logging_config_creates_logger(mocker):
     """Should call logging.config.dictConfig with correct structure."""
     mock_dict_config = mocker.patch("logging.config.dictConfig")
+    mocker.patch.object(log_helpers, "_configured_loggers", set())
     log_helpers.logging_config("my_logger")
     mock_dict_config.assert_called_once()
     config_arg = mock_dict_config.call_args[0][0]
@@ -31,6 +36,96 @@ def test_logging_config_creates_logger(mocker):
     assert "loggers" in config_arg
 
 
+def test_logging_config_runs_once_per_name(mocker):
+    """A name that is already configured should not re-run dictConfig."""
+    mock_dict_config = mocker.patch("logging.config.dictConfig")
+    mocker.patch.object(log_helpers, "_configured_loggers", set())
+    log_helpers.logging_config("repeat_logger")
+    log_helpers.logging_config("repeat_logger")
+    log_helpers.logging_config("other_logger")
+    assert mock_dict_config.call_count == 2
+
+
+def test_logging_config_leaves_base_config_intact(mocker):
+    """dictConfig consumes its handler entries; the shared base must survive."""
+    mocker.patch.object(log_helpers, "_configured_loggers", set())
+    log_helpers.logging_config("first_logger")
+    log_helpers.logging_config("second_logger")
+    assert "()" in log_helpers._BASE_CONFIG["handlers"]["console"]
+    assert "loggers" not in log_helpers._BASE_CONFIG
+    assert logging.getLogger("second_logger").handlers
+
+
+def test_queue_handler_keeps_exc_info_and_merges_args():
+    """Queued records keep exc_info for the ECS formatter; args are merged up front."""
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        record = logging.getLogger("x").makeRecord(
+            "x", logging.ERROR, __file__, 1, "failed %s", ("step",), sys.exc_info()
+        )
+    prepared = log_helpers._queue_handler.prepare(record)
+    assert prepared.msg == "failed step"
+    assert prepared.args is None
+    assert prepared.exc_info[0] is ValueError
+
+
+def test_queued_extra_is_unaffected_by_later_caller_mutation(monkeypatch):
+    """Changing an extra dict after logging does not change the queued payload."""
+    log_queue = queue.SimpleQueue()
+    handler = log_helpers.EcsQueueHandler(log_queue)
+    monkeypatch.setattr(log_helpers, "_listener_running", True)
+    base_logger = logging.getLogger("queued_extra_logger")
+    base_logger.propagate = False
+    base_logger.setLevel(logging.INFO)
+    base_logger.addHandler(handler)
+    try:
+        payload = {"step": "extract", "rows": [1, 2]}
+        base_logger.info("queued", extra={"data": payload, "items": payload["rows"]})
+        payload["step"] = "changed"
+        payload["added"] = True
+        payload["rows"].append(3)
+    finally:
+        base_logger.removeHandler(handler)
+
+    record = log_queue.get_nowait()
+    emitted = json.loads(log_helpers.OrjsonEcsFormatter(exclude_fields=log_helpers.EXCLUDED_FIELDS).format(record))
+    assert emitted["data"]["step"] == "extract"
+    assert "added" not in emitted["data"]
+    assert emitted["items"] == [1, 2]
+
+
+@pytest.mark.parametrize("extra", [
+    {},
+    {"service": "file-storage", "data": {"z": 1, "a": [1, 2], 3: "int key"}},
+    {"huge": 2**70},
+])
+def test_orjson_ecs_formatter_matches_ecs_logging(extra):
+    """The orjson encoder emits the same document and key order as ecs_logging."""
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        exc_info = sys.exc_info()
+    record = logging.getLogger("x").makeRecord(
+        "x", logging.ERROR, __file__, 1, "héllo %s", ("world",), exc_info, extra=extra
+    )
+    expected = ecs_logging.StdlibFormatter(exclude_fields=log_helpers.EXCLUDED_FIELDS).format(record)
+    actual = log_helpers.OrjsonEcsFormatter(exclude_fields=log_helpers.EXCLUDED_FIELDS).format(record)
+
+    assert json.loads(actual) == json.loads(expected)
+    assert list(json.loads(actual))[:3] == ["@timestamp", "log.level", "message"]
+    assert list(json.loads(actual)) == list(json.loads(expected))
+
+
+def test_queue_handler_writes_inline_after_stop(mocker):
+    """Once the listener is stopped, records go straight to the console handler."""
+    mocker.patch.object(log_helpers, "_listener_running", False)
+    handle = mocker.patch.object(log_helpers._console_handler, "handle")
+    record = logging.getLogger("x").makeRecord("x", logging.INFO, __file__, 1, "late", (), None)
+    log_helpers._queue_handler.emit(record)
+    handle.assert_called_once_with(record)
+
+
 # === validate_log_fields ===
 def test_validate_log_fields_valid_enum_instances():
     """Should accept valid Enum members and return their string values."""
@@ -140,6 +235,15 @@ def test_process_handles_invalid_extra(mocker):
     # assert "environment" in kwargs["extra"]
 
 
+def test_records_below_console_level_skip_process(mocker):
+    """Debug records are dropped by the console handler, so the adapter never normalizes them."""
+    adapter = log_helpers.get_logger("console_gate_test")
+    spy = mocker.spy(adapter, "process")
+    adapter.debug("hidden", extra={"data": DummyModel(x=1, y="a")})
+    spy.assert_not_called()
+    assert adapter.logger.getEffectiveLevel() >= logging.getLevelName(log_helpers.CONSOLE_LOG_LEVEL)
+
+
 # === get_logger ===
 def test_get_logger_returns_valid_adapter(mocker):
     """Should configure logger and return ValidatingLoggerAdapter."""
@@ -147,3 +251,52 @@ def test_get_logger_returns_valid_adapter(mocker):
     logger = log_helpers.get_logger("abc")
     mock_conf.assert_called_once_with("abc")
     assert isinstance(logger, log_helpers.ValidatingLoggerAdapter)
+
+
+def test_normalizer_is_resolved_once_per_type():
+    """Repeated values of one type reuse the cached conversion."""
+    adapter = log_helpers.ValidatingLoggerAdapter(logging.getLogger("x"), {})
+    log_helpers._pick_normalizer.cache_clear()
+    adapter.normalize_extra({"a": DummyData(a=1, b="b"), "b": DummyData(a=2, b="c"), "c": 1})
+    info = log_helpers._pick_normalizer.cache_info()
+    assert info.misses == 2
+    assert info.hits == 1
+
+
+def test_normalize_extra_returns_scalar_only_extra_as_is():
+    """Scalar-only extras are returned without copying."""
+    adapter = log_helpers.ValidatingLoggerAdapter(logging.getLogger("x"), {})
+    extra = {"service": "file-storage", "count": 1, "ratio": 0.5, "ok": True, "none": None}
+    assert adapter.normalize_extra(extra) is extra
+
+
+def test_log_fast_builds_normalized_record(mocker):
+    """log_fast hands one normalized record to the logger when enabled."""
+    base_logger = logging.getLogger("fast_logger")
+    base_logger.setLevel(logging.INFO)
+    handle = mocker.patch.object(base_logger, "handle")
+    adapter = log_helpers.ValidatingLoggerAdapter(base_logger, {})
+
+    adapter.log_fast(logging.DEBUG, "skipped")
+    adapter.log_fast(logging.INFO, "row parsed", row=3, service=ServiceLog.FILE_STORAGE)
+
+    handle.assert_called_once()
+    record = handle.call_args[0][0]
+    assert record.getMessage() == "row parsed"
+    assert record.row == 3
+    assert record.service == "file-storage"
+    assert record.environment == log_helpers.ENV
+
+
+def test_log_fast_rejects_invalid_and_reserved_fields(mocker):
+    """log_fast validates service/log_type and refuses to overwrite record attributes."""
+    base_logger = logging.getLogger("fast_logger_guard")
+    base_logger.setLevel(logging.INFO)
+    handle = mocker.patch.object(base_logger, "handle")
+    adapter = log_helpers.ValidatingLoggerAdapter(base_logger, {})
+
+    with pytest.raises(ValueError):
+        adapter.log_fast(logging.INFO, "bad service", service="not-a-service")
+    with pytest.raises(KeyError):
+        adapter.log_fast(logging.INFO, "clobber", levelname="FAKE")
+    handle.assert_not_called()
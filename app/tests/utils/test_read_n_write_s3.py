@@ -1,5 +1,6 @@
 import io
 import json
+from datetime import datetime
 from models.class_models import StatusEnum
 import pytest
 from unittest.mock import MagicMock
@@ -35,6 +36,7 @@ def test_put_object_with_buffer_success(mock_client, bucket_and_key):
     buf = io.BytesIO(b"data")
     result = s3_utils.put_object(mock_client, *bucket_and_key, buf)
     mock_client.upload_fileobj.assert_called_once()
+    assert mock_client.upload_fileobj.call_args.kwargs["Config"] is s3_utils._UPLOAD_CONFIG
     assert result["status"] == StatusEnum.SUCCESS
 
 
@@ -97,6 +99,55 @@ def test_copy_object_between_buckets_fail(mocker):
     assert result["status"] == StatusEnum.FAILED
 
 
+def test_copy_object_between_buckets_falls_back_to_multipart(mocker):
+    """Objects too large for CopyObject should go through the managed multipart copy."""
+    mock_client = MagicMock()
+    mock_client.copy_object.side_effect = ClientError(
+        {"Error": {
+            "Code": "InvalidRequest",
+            "Message": "The specified copy source is larger than the maximum allowable size for a copy source: 5368709120",
+        }},
+        "copy_object",
+    )
+    mocker.patch.object(s3_utils.aws_connection, "S3Connector", return_value=MagicMock(client=mock_client))
+    result = s3_utils.copy_object_between_buckets("big-src", "key", "dest", "key2")
+    assert result["status"] == StatusEnum.SUCCESS
+    mock_client.copy.assert_called_once_with(
+        {"Bucket": "big-src", "Key": "key"}, "dest", "key2",
+        Config=s3_utils._MULTIPART_COPY_CONFIG,
+    )
+
+
+def test_copy_object_between_buckets_checks_source_size(mocker):
+    """Without the size message, the source ContentLength decides the fallback."""
+    mock_client = MagicMock()
+    mock_client.copy_object.side_effect = ClientError(
+        {"Error": {"Code": "InvalidRequest", "Message": "Bad request"}}, "copy_object"
+    )
+    mock_client.head_object.return_value = {"ContentLength": s3_utils._COPY_OBJECT_MAX_SIZE + 1}
+    mocker.patch.object(s3_utils.aws_connection, "S3Connector", return_value=MagicMock(client=mock_client))
+    result = s3_utils.copy_object_between_buckets("huge-src", "key", "dest", "key2")
+    assert result["status"] == StatusEnum.SUCCESS
+    mock_client.copy.assert_called_once()
+
+
+def test_copy_object_between_buckets_other_invalid_request_fails(mocker):
+    """InvalidRequest errors unrelated to size are not retried as a multipart copy."""
+    mock_client = MagicMock()
+    mock_client.copy_object.side_effect = ClientError(
+        {"Error": {
+            "Code": "InvalidRequest",
+            "Message": "This copy request is illegal because it is trying to copy an object to itself",
+        }},
+        "copy_object",
+    )
+    mock_client.head_object.return_value = {"ContentLength": 1024}
+    mocker.patch.object(s3_utils.aws_connection, "S3Connector", return_value=MagicMock(client=mock_client))
+    result = s3_utils.copy_object_between_buckets("self-src", "key", "self-src", "key")
+    assert result["status"] == StatusEnum.FAILED
+    mock_client.copy.assert_not_called()
+
+
 # === object_exists ===
 def test_object_exists_true(mock_client, bucket_and_key):
     """Should return True and metadata when object exists."""
@@ -177,6 +228,24 @@ def test_write_json_to_s3_exception(mocker, mock_client):
     assert "crash" in result["error"]
 
 
+@pytest.mark.parametrize("extra", [{}, {"huge": 2**70}])
+def test_write_json_to_s3_body_matches_json_dumps(mocker, mock_client, extra):
+    """Uploaded bytes decode to the same document json.dumps(default=str) produced."""
+    put = mocker.patch.object(s3_utils, "put_object", return_value={"status": "Success"})
+    mocker.patch.object(s3_utils.aws_connection, "S3Connector", return_value=MagicMock(client=mock_client, bucket_name="bucket"))
+
+    data = {
+        "items": [{"名前": "値", "qty": 2, 1: "int key"}],
+        "status": StatusEnum.SUCCESS,
+        "proceed_at": datetime(2024, 1, 2, 3, 4, 5),
+        **extra,
+    }
+    s3_utils.write_json_to_s3(data, "bucket", "key.json")
+
+    body = put.call_args.args[3].getvalue()
+    assert json.loads(body) == json.loads(json.dumps(data, ensure_ascii=False, default=str))
+
+
 # === read_json_from_s3 ===
 def test_read_json_from_s3_success(mocker, mock_client):
     """Should parse JSON successfully."""
@@ -187,6 +256,16 @@ def test_read_json_from_s3_success(mocker, mock_client):
     assert result == {"a": 1}
 
 
+def test_read_json_from_s3_accepts_nan(mocker, mock_client):
+    """Objects written by json.dumps may contain NaN, which strict parsers reject."""
+    buffer = io.BytesIO(json.dumps({"a": float("nan"), "b": "é"}, ensure_ascii=False).encode())
+    mocker.patch.object(s3_utils, "get_object", return_value=buffer)
+    mocker.patch.object(s3_utils.aws_connection, "S3Connector", return_value=MagicMock(client=mock_client))
+    result = s3_utils.read_json_from_s3("bucket", "key.json")
+    assert result["b"] == "é"
+    assert result["a"] != result["a"]
+
+
 def test_read_json_from_s3_none(mocker, mock_client):
     """Should return None when no buffer returned."""
     mocker.patch.object(s3_utils, "get_object", return_value=None)
@@ -236,6 +315,30 @@ def test_list_objects_with_prefix_fail(mocker):
     assert result == []
 
 
+# === list_common_prefixes ===
+def test_list_common_prefixes_success(mocker):
+    """Should return only the folder prefixes, listed with a delimiter."""
+    paginator = MagicMock()
+    paginator.paginate.return_value = [
+        {"CommonPrefixes": [{"Prefix": "v/001/"}]},
+        {"CommonPrefixes": [{"Prefix": "v/002/"}]},
+    ]
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value = paginator
+    mocker.patch.object(s3_utils.aws_connection, "S3Connector", return_value=MagicMock(client=mock_client))
+
+    result = s3_utils.list_common_prefixes("prefix-bucket", "v/")
+    assert result == ["v/001/", "v/002/"]
+    paginator.paginate.assert_called_once_with(Bucket="prefix-bucket", Prefix="v/", Delimiter="/")
+
+
+def test_list_common_prefixes_fail(mocker):
+    """Should return empty list on exception."""
+    mocker.patch.object(s3_utils.aws_connection, "S3Connector", side_effect=Exception("init fail"))
+    result = s3_utils.list_common_prefixes("failing-bucket", "prefix")
+    assert result == []
+
+
 # === select_latest_rerun ===
 def test_select_latest_rerun_with_reruns():
     """Should return highest rerun file."""